@@ -8,12 +8,42 @@ Implements the DatabaseProtocol for dependency injection.
 
 import logging
 import sqlite3
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional
 
 from magicguard.core.exceptions import DatabaseError, SignatureNotFoundError
+from magicguard.utils._hex import normalize_magic_bytes
 from magicguard.utils.logger import get_logger
 
+# Applied once per connection. WAL with synchronous=NORMAL avoids an fsync
+# per committed INSERT; in-memory databases silently keep their own journal.
+# Switching to WAL needs write access, so it is attempted separately.
+_WAL_PRAGMA = "PRAGMA journal_mode=WAL"
+_CONNECTION_PRAGMAS = """
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-16000;
+    PRAGMA mmap_size=268435456;
+"""
+
+# Shared SQL text so every call hits sqlite3's per-connection statement cache.
+# Duplicates are skipped by the UPSERT clause and show up as rowcount == 0.
+_INSERT_SQL = (
+    "INSERT INTO signatures "
+    "(extension, magic_bytes, offset, description, mime_type) "
+    "VALUES (?, ?, ?, ?, ?) "
+    "ON CONFLICT (extension, magic_bytes, offset) DO NOTHING"
+)
+# Candidates come back in index order, so lookups never need a sort step
+_SELECT_BY_EXTENSION_SQL = (
+    "SELECT magic_bytes, offset FROM signatures WHERE extension = ? "
+    "ORDER BY magic_bytes, offset"
+)
+_STATEMENT_CACHE_SIZE = 256
+
 
 class Database:
     """Manages file signature database operations.
@@ -59,11 +89,23 @@ class Database:
             self.logger.debug(f"Initializing database at: {self.db_path}")
             
             # Create parent directory if it doesn't exist
-            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            if str(self.db_path) != ":memory:":
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
             
             # Connect to database
-            self.conn = sqlite3.connect(str(self.db_path))
+            # Autocommit mode: writes are grouped only by transaction()
+            self.conn = sqlite3.connect(
+                str(self.db_path),
+                isolation_level=None,
+                cached_statements=_STATEMENT_CACHE_SIZE,
+            )
             self.conn.row_factory = sqlite3.Row
+            try:
+                self.conn.execute(_WAL_PRAGMA)
+            except sqlite3.OperationalError as e:
+                # Read-only files keep their current journal mode
+                self.logger.debug(f"Could not enable WAL journal mode: {e}")
+            self.conn.executescript(_CONNECTION_PRAGMAS)
             
             # Initialize schema if needed
             self._initialize_schema()
@@ -93,15 +135,16 @@ class Database:
     
     @staticmethod
     def _normalize_magic_bytes(magic_bytes: str) -> str:
-        """Normalize magic bytes to uppercase hex without spaces.
+        """Normalize magic bytes to uppercase hex without separators.
         
         Args:
-            magic_bytes: Hex string (may have spaces, mixed case)
+            magic_bytes: Hex string (may have spaces, tabs, newlines,
+                dashes or colons, mixed case)
             
         Returns:
-            Normalized hex string (uppercase, no spaces)
+            Normalized hex string (uppercase, no separators)
         """
-        return magic_bytes.upper().replace(' ', '')
+        return normalize_magic_bytes(magic_bytes)
     
     def _validate_signature_input(
         self, extension: str, magic_bytes: str
@@ -118,6 +161,12 @@ class Database:
         Raises:
             DatabaseError: If input is invalid
         """
+        if not isinstance(extension, str) or not isinstance(magic_bytes, str):
+            raise DatabaseError(
+                f"Extension and magic bytes must be strings, got "
+                f"{type(extension).__name__} and {type(magic_bytes).__name__}"
+            )
+        
         # Normalize
         norm_ext = self._normalize_extension(extension)
         norm_hex = self._normalize_magic_bytes(magic_bytes)
@@ -143,99 +192,55 @@ class Database:
     def _initialize_schema(self) -> None:
         """Create database schema if it doesn't exist.
         
+        The schema is checked with a plain read first, so opening an
+        up-to-date database never takes the write lock and works on
+        read-only files.
+        
         Raises:
             DatabaseError: If schema creation fails
         """
         try:
             self.logger.debug("Checking/creating database schema")
             
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS signatures (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    extension TEXT NOT NULL,
-                    magic_bytes TEXT NOT NULL,
-                    offset INTEGER DEFAULT 0,
-                    description TEXT,
-                    mime_type TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(extension, magic_bytes, offset)
+            existing = {
+                row[0] for row in self.conn.execute(
+                    "SELECT name FROM sqlite_master "
+                    "WHERE name IN ('signatures', 'idx_extension')"
                 )
-            """)
-            
-            # Create index for faster lookups
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_extension 
-                ON signatures(extension)
-            """)
+            }
+            
+            if "signatures" not in existing:
+                with self.transaction():
+                    self.conn.execute("""
+                        CREATE TABLE IF NOT EXISTS signatures (
+                            id INTEGER PRIMARY KEY AUTOINCREMENT,
+                            extension TEXT NOT NULL,
+                            magic_bytes TEXT NOT NULL,
+                            offset INTEGER DEFAULT 0,
+                            description TEXT,
+                            mime_type TEXT,
+                            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                            UNIQUE(extension, magic_bytes, offset)
+                        )
+                    """)
+            
+            if "idx_extension" in existing:
+                # The UNIQUE constraint's index already covers extension
+                # lookups; drop the redundant index older databases carry.
+                # Keeping it is harmless, e.g. when the file is read-only.
+                try:
+                    with self.transaction():
+                        self.conn.execute("DROP INDEX IF EXISTS idx_extension")
+                except sqlite3.OperationalError as e:
+                    self.logger.debug(f"Could not drop legacy idx_extension: {e}")
             
-            self.conn.commit()
             self.logger.debug("Database schema initialized successfully")
             
         except sqlite3.Error as e:
             error_msg = f"Failed to create database schema: {str(e)}"
             self.logger.error(error_msg)
             raise DatabaseError(error_msg)
-    @staticmethod
-    def _normalize_extension(extension: str) -> str:
-        """Normalize file extension to lowercase without leading dot.
-        
-        Args:
-            extension: File extension (may include dot, mixed case)
-            
-        Returns:
-            Normalized extension (lowercase, no dot)
-        """
-        return extension.lower().lstrip('.')
-    
-    @staticmethod
-    def _normalize_magic_bytes(magic_bytes: str) -> str:
-        """Normalize magic bytes to uppercase hex without spaces.
-        
-        Args:
-            magic_bytes: Hex string (may have spaces, mixed case)
-            
-        Returns:
-            Normalized hex string (uppercase, no spaces)
-        """
-        return magic_bytes.upper().replace(' ', '')
     
-    def _validate_signature_input(
-        self, extension: str, magic_bytes: str
-    ) -> tuple[str, str]:
-        """Validate and normalize signature input.
-        
-        Args:
-            extension: File extension
-            magic_bytes: Hex string of magic bytes
-            
-        Returns:
-            Tuple of (normalized_extension, normalized_magic_bytes)
-            
-        Raises:
-            DatabaseError: If input is invalid
-        """
-        # Normalize
-        norm_ext = self._normalize_extension(extension)
-        norm_hex = self._normalize_magic_bytes(magic_bytes)
-        
-        # Validate extension
-        if not norm_ext:
-            raise DatabaseError("Extension cannot be empty")
-        
-        # Validate magic bytes
-        if not norm_hex:
-            raise DatabaseError("Magic bytes cannot be empty")
-        
-        # Validate hex format
-        try:
-            bytes.fromhex(norm_hex)
-        except ValueError:
-            raise DatabaseError(
-                f"Invalid hex string for magic bytes: '{magic_bytes}'"
-            )
-        
-        return norm_ext, norm_hex
     def get_signatures(self, extension: str) -> list[tuple[str, int]]:
         """Get all signatures for a file extension.
         
@@ -254,19 +259,18 @@ class Database:
             self.logger.debug(f"Querying signatures for extension: .{extension}")
             norm_ext = self._normalize_extension(extension)
             
+            # Plain tuple rows are already (magic_bytes, offset), so the
+            # result list is built once without re-packing sqlite3.Row objects
             cursor = self.conn.cursor()
-            cursor.execute(
-                "SELECT magic_bytes, offset FROM signatures WHERE extension = ?",
-                (norm_ext,)
-            )
-            results = cursor.fetchall()
+            cursor.row_factory = None
+            cursor.execute(_SELECT_BY_EXTENSION_SQL, (norm_ext,))
+            signatures = cursor.fetchall()
             
-            if not results:
+            if not signatures:
                 error_msg = f"No signature found for extension '.{norm_ext}'"
                 self.logger.warning(error_msg)
                 raise SignatureNotFoundError(error_msg)
             
-            signatures = [(row["magic_bytes"], row["offset"]) for row in results]
             self.logger.debug(
                 f"Found {len(signatures)} signature(s) for '.{norm_ext}'"
             )
@@ -278,6 +282,55 @@ class Database:
             self.logger.error(error_msg)
             raise DatabaseError(error_msg)
     
+    def get_signatures_multi(
+        self, extensions: Iterable[str]
+    ) -> dict[str, list[tuple[str, int]]]:
+        """Get signatures for several extensions with a single query.
+        
+        Unlike get_signatures(), unknown extensions are not an error; they
+        are simply absent from the result. Each list is ordered the same
+        way get_signatures() orders it.
+        
+        Args:
+            extensions: File extensions (may include dot, mixed case)
+            
+        Returns:
+            Dictionary mapping each normalized extension that has
+            signatures to its list of (magic_bytes, offset) tuples
+            
+        Raises:
+            DatabaseError: If database query fails
+        """
+        norm_exts = list(dict.fromkeys(
+            self._normalize_extension(ext) for ext in extensions
+        ))
+        if not norm_exts:
+            return {}
+        
+        try:
+            self.logger.debug(f"Querying signatures for {len(norm_exts)} extension(s)")
+            
+            placeholders = ", ".join("?" * len(norm_exts))
+            cursor = self.conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(
+                "SELECT extension, magic_bytes, offset FROM signatures "
+                f"WHERE extension IN ({placeholders}) "
+                "ORDER BY extension, magic_bytes, offset",
+                norm_exts
+            )
+            
+            signatures: defaultdict[str, list[tuple[str, int]]] = defaultdict(list)
+            for extension, magic_bytes, offset in cursor:
+                signatures[extension].append((magic_bytes, offset))
+            
+            return dict(signatures)
+            
+        except sqlite3.Error as e:
+            error_msg = f"Failed to query signatures: {str(e)}"
+            self.logger.error(error_msg)
+            raise DatabaseError(error_msg)
+    
     def add_signature(
         self,
         extension: str,
@@ -308,26 +361,98 @@ class Database:
             
             cursor = self.conn.cursor()
             cursor.execute(
-                """
-                INSERT INTO signatures 
-                (extension, magic_bytes, offset, description, mime_type)
-                VALUES (?, ?, ?, ?, ?)
-                """,
+                _INSERT_SQL,
                 (norm_ext, norm_hex, offset, description, mime_type)
             )
-            self.conn.commit()
             
-            self.logger.info(f"Successfully added signature for '.{norm_ext}'")
-            
-        except sqlite3.IntegrityError:
+        except sqlite3.Error as e:
+            error_msg = f"Failed to add signature for '.{norm_ext}': {str(e)}"
+            self.logger.error(error_msg)
+            raise DatabaseError(error_msg)
+        
+        if cursor.rowcount == 0:
             error_msg = (
                 f"Signature for '.{norm_ext}' with magic bytes {norm_hex} "
                 f"at offset {offset} already exists"
             )
             self.logger.warning(error_msg)
             raise DatabaseError(error_msg)
+        
+        self.logger.info(f"Successfully added signature for '.{norm_ext}'")
+    
+    def add_signatures(
+        self,
+        signatures: Iterable[
+            tuple[str, str, int, Optional[str], Optional[str]]
+        ],
+    ) -> int:
+        """Add many signatures in a single transaction.
+        
+        Each entry is validated and normalized like add_signature().
+        Invalid entries are logged and skipped, and entries that already
+        exist are silently ignored, so this never fails part-way through
+        because of bad or duplicate input.
+        
+        Args:
+            signatures: Iterable of (extension, magic_bytes, offset,
+                description, mime_type) tuples
+                
+        Returns:
+            Number of signatures actually inserted
+            
+        Raises:
+            DatabaseError: If the insert fails
+        """
+        rows = []
+        for extension, magic_bytes, offset, description, mime_type in signatures:
+            try:
+                norm_ext, norm_hex = self._validate_signature_input(
+                    extension, magic_bytes
+                )
+            except DatabaseError as e:
+                self.logger.warning(f"Skipped signature for '.{extension}': {e}")
+                continue
+            rows.append((norm_ext, norm_hex, offset, description, mime_type))
+        
+        try:
+            self.logger.debug(f"Bulk adding {len(rows)} signature(s)")
+            
+            with self.transaction():
+                cursor = self.conn.executemany(_INSERT_SQL, rows)
+            
+            inserted = cursor.rowcount
+            self.logger.info(f"Successfully added {inserted} signature(s)")
+            return inserted
+            
         except sqlite3.Error as e:
-            error_msg = f"Failed to add signature for '.{norm_ext}': {str(e)}"
+            error_msg = f"Failed to add signatures: {str(e)}"
+            self.logger.error(error_msg)
+            raise DatabaseError(error_msg)
+    
+    def iter_signatures(self) -> Iterator[tuple[str, str, int]]:
+        """Iterate over every signature without loading them all at once.
+        
+        Rows are read from the cursor as they are consumed, ordered by
+        extension and then insertion order.
+        
+        Yields:
+            Tuples of (extension, magic_bytes, offset)
+            
+        Raises:
+            DatabaseError: If query fails
+        """
+        try:
+            self.logger.debug("Iterating over all signatures")
+            
+            cursor = self.conn.execute(
+                "SELECT extension, magic_bytes, offset FROM signatures "
+                "ORDER BY extension, id"
+            )
+            for row in cursor:
+                yield row["extension"], row["magic_bytes"], row["offset"]
+                
+        except sqlite3.Error as e:
+            error_msg = f"Failed to iterate signatures: {str(e)}"
             self.logger.error(error_msg)
             raise DatabaseError(error_msg)
     
@@ -379,6 +504,59 @@ class Database:
             self.logger.error(error_msg)
             raise DatabaseError(error_msg)
     
+    def truncate_signatures(self) -> int:
+        """Remove all signatures from the database.
+        
+        Keeps the schema and connection intact, which makes it much cheaper
+        than recreating the database when a clean slate is needed.
+        
+        Returns:
+            Number of signatures removed
+            
+        Raises:
+            DatabaseError: If deletion fails
+        """
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute("DELETE FROM signatures")
+            
+            self.logger.debug(f"Removed {cursor.rowcount} signatures")
+            return cursor.rowcount
+            
+        except sqlite3.Error as e:
+            error_msg = f"Failed to truncate signatures: {str(e)}"
+            self.logger.error(error_msg)
+            raise DatabaseError(error_msg)
+    
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group writes into one explicit transaction.
+        
+        Issues BEGIN IMMEDIATE on entry, then COMMIT on success or ROLLBACK
+        if the block or the COMMIT raises. Nested use joins the enclosing
+        transaction.
+        
+        Yields:
+            None
+            
+        Raises:
+            sqlite3.Error: If the transaction cannot be started or committed
+        """
+        if self.conn.in_transaction:
+            yield
+            return
+        
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+            self.conn.execute("COMMIT")
+        except BaseException:
+            # A failed COMMIT can leave the transaction open; SQLite may
+            # also have rolled it back already
+            if self.conn.in_transaction:
+                self.conn.execute("ROLLBACK")
+            raise
+    
     def close(self) -> None:
         """Close database connection."""
         if self.conn:
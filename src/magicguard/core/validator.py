@@ -9,6 +9,8 @@ database and file readers.
 
 import hashlib
 import logging
+import os
+import stat
 from pathlib import Path
 from typing import Optional
 
@@ -97,19 +99,25 @@ class FileValidator:
         
         self.logger.info(f"Validating file: {file_path}")
         
-        # Verify file exists and is readable
-        if not path.exists():
+        # Existence, file type and size all come from a single stat() call
+        try:
+            file_stat = os.stat(file_path)
+        except (FileNotFoundError, NotADirectoryError):
             error_msg = f"File not found: '{file_path}'"
             self.logger.error(error_msg)
             raise FileReadError(error_msg)
+        except OSError as e:
+            error_msg = f"Cannot access file '{file_path}': {str(e)}"
+            self.logger.error(error_msg)
+            raise FileReadError(error_msg)
         
-        if not path.is_file():
+        if not stat.S_ISREG(file_stat.st_mode):
             error_msg = f"Path is not a file: '{file_path}'"
             self.logger.error(error_msg)
             raise FileReadError(error_msg)
         
         # Check file size
-        file_size = path.stat().st_size
+        file_size = file_stat.st_size
         if file_size > MAX_FILE_SIZE:
             error_msg = (
                 f"File too large: {file_size} bytes (max: {MAX_FILE_SIZE})"
@@ -218,11 +226,10 @@ class FileValidator:
         self.logger.debug(f"Calculating SHA-256 hash for: {file_path}")
         
         try:
-            sha256 = hashlib.sha256()
-            with open(file_path, 'rb') as f:
-                # Read in chunks to handle large files
-                for chunk in iter(lambda: f.read(8192), b''):
-                    sha256.update(chunk)
+            # file_digest runs its read loop in C; unbuffered, so reads go
+            # straight into its own buffer
+            with open(file_path, 'rb', buffering=0) as f:
+                sha256 = hashlib.file_digest(f, 'sha256')
             
             file_hash = sha256.hexdigest()
             self.logger.debug(f"SHA-256 hash: {file_hash}")
@@ -14,9 +14,15 @@ from magicguard.utils.config import (
     get_data_dir,
     get_log_dir,
     get_log_level,
+    get_log_ndjson,
     ensure_directories,
 )
-from magicguard.utils.logger import get_logger, setup_logging, cleanup_old_logs
+from magicguard.utils.logger import (
+    get_logger,
+    logger_for,
+    setup_logging,
+    cleanup_old_logs,
+)
 from magicguard.utils.data_loader import (
     DataLoader,
     initialize_default_signatures,
@@ -34,9 +40,11 @@ __all__ = [
     "get_data_dir",
     "get_log_dir",
     "get_log_level",
+    "get_log_ndjson",
     "ensure_directories",
     # Logger exports
     "get_logger",
+    "logger_for",
     "setup_logging",
     "cleanup_old_logs",
     # Data loader exports
@@ -0,0 +1,21 @@
+"""Magic byte hex string helpers.
+
+Shared by the database layer and the signature loader so both accept
+exactly the same spellings of a magic byte sequence.
+"""
+
+# Separators accepted (and dropped) in magic byte hex strings
+_HEX_SEPARATORS = str.maketrans("", "", " \t\n-:")
+
+
+def normalize_magic_bytes(magic_bytes: str) -> str:
+    """Normalize magic bytes to uppercase hex without separators.
+    
+    Args:
+        magic_bytes: Hex string (may have spaces, tabs, newlines, dashes or
+            colons, mixed case)
+        
+    Returns:
+        Normalized hex string (uppercase, no separators)
+    """
+    return magic_bytes.translate(_HEX_SEPARATORS).upper()
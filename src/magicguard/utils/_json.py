@@ -0,0 +1,50 @@
+"""JSON encode/decode helpers.
+
+Prefers orjson when it is installed and falls back to the standard
+library otherwise. Both paths work on bytes so callers can read and
+write files without an extra decode/encode step.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+# orjson.JSONDecodeError subclasses this, so one except clause covers both
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: bytes) -> Any:
+    """Parse JSON from bytes.
+    
+    Args:
+        data: UTF-8 encoded JSON document
+        
+    Returns:
+        Parsed JSON data
+        
+    Raises:
+        JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON.
+    
+    Args:
+        obj: JSON-serializable object
+        indent: Pretty-print with two-space indentation
+        
+    Returns:
+        UTF-8 encoded JSON document (non-ASCII characters kept as-is)
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
@@ -40,12 +40,14 @@ LOG_FILE_FORMAT = "%Y-%m-%d.log"  # Daily log files: YYYY-MM-DD.log
 MAX_LOG_FILES = 30  # Keep 30 days of logs
 LOG_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
 LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+LOG_NDJSON = False  # Write file logs as JSON lines instead of LOG_FORMAT
 
 # Environment variable names for overrides
 ENV_DB_PATH = "MAGICGUARD_DB_PATH"
 ENV_LOG_LEVEL = "MAGICGUARD_LOG_LEVEL"
 ENV_LOG_DIR = "MAGICGUARD_LOG_DIR"
 ENV_DATA_DIR = "MAGICGUARD_DATA_DIR"
+ENV_LOG_NDJSON = "MAGICGUARD_LOG_NDJSON"
 
 
 def get_database_path() -> Path:
@@ -116,6 +118,20 @@ def get_log_level() -> str:
     return os.getenv(ENV_LOG_LEVEL, DEFAULT_LOG_LEVEL).upper()
 
 
+def get_log_ndjson() -> bool:
+    """Check whether file logs should be written as JSON lines.
+    
+    Checks environment variable first, then returns LOG_NDJSON.
+    
+    Returns:
+        True if the NDJSON file handler should be used
+    """
+    env_value = os.getenv(ENV_LOG_NDJSON)
+    if env_value is None:
+        return LOG_NDJSON
+    return env_value.strip().lower() in ("1", "true", "yes", "on")
+
+
 def ensure_directories() -> None:
     """Ensure all required application directories exist.
     
@@ -5,13 +5,48 @@ into the signature database. Supports the DataLoaderProtocol for dependency
 injection.
 """
 
-import json
 import logging
+import os
+import tempfile
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+from magicguard.utils._hex import normalize_magic_bytes
+from magicguard.utils._json import JSONDecodeError, dumps, loads
 from magicguard.utils.logger import get_logger
 
+# Files larger than this are stream-parsed when ijson is available
+STREAMING_THRESHOLD = 1_000_000  # bytes
+
+# Number of signatures inserted per transaction when streaming
+STREAMING_BATCH_SIZE = 500
+
+# Number of validate_source() results remembered per DataLoader
+VALIDATE_CACHE_SIZE = 128
+
+# Bundled signatures.json location, remembered after the first search
+_default_signatures_path: Optional[Path] = None
+
+
+def _read_json(path: Path) -> Any:
+    """Read and parse a JSON file.
+    
+    Args:
+        path: Path to the JSON file
+        
+    Returns:
+        Parsed JSON data
+    """
+    return loads(path.read_bytes())
+
 
 class DataLoader:
     """Loads file signatures from JSON into database.
@@ -27,6 +62,9 @@ class DataLoader:
             logger: Logger instance. If None, creates logger for this module.
         """
         self.logger = logger or get_logger(__name__)
+        
+        # validate_source() results keyed by (abspath, mtime_ns, size)
+        self._validate_cache: OrderedDict[tuple[str, int, int], bool] = OrderedDict()
     
     def load_signatures(self, source_path: str, database) -> int:
         """Load signatures from JSON file into database.
@@ -51,47 +89,207 @@ class DataLoader:
             self.logger.error(error_msg)
             raise FileNotFoundError(error_msg)
         
+        if ijson is not None and source.stat().st_size > STREAMING_THRESHOLD:
+            return self._load_streaming(source, database)
+        
         # Load and parse JSON
-        with open(source, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _read_json(source)
+        
+        return self.load_data(data, database, source_name=source_path)
+    
+    def _load_streaming(self, source: Path, database) -> int:
+        """Stream-parse a large signature file and insert it in batches.
         
-        # Validate structure
-        if not self._validate_structure(data):
-            error_msg = f"Invalid JSON structure in {source_path}"
+        Signatures are read one at a time with ijson, validated as they
+        arrive and inserted every STREAMING_BATCH_SIZE entries, so the whole
+        document is never held in memory. When the database supports
+        transaction(), all batches share one transaction, so an invalid
+        entry anywhere in the file loads nothing, as with load_data().
+        
+        Args:
+            source: Path to JSON file containing signatures
+            database: DatabaseProtocol instance to load into
+            
+        Returns:
+            Number of signatures successfully loaded
+            
+        Raises:
+            ValueError: If a signature entry is invalid or the JSON is malformed
+        """
+        self.logger.debug(f"Streaming signatures from large file: {source}")
+        
+        loaded_count = 0
+        skipped_count = 0
+        batch = []
+        
+        def flush() -> None:
+            nonlocal loaded_count, skipped_count
+            loaded, skipped = self._add_rows(batch, database)
+            loaded_count += loaded
+            skipped_count += skipped
+            batch.clear()
+        
+        transaction = getattr(database, 'transaction', None)
+        with transaction() if transaction is not None else nullcontext():
+            for row in self._iter_streamed_rows(source):
+                batch.append(row)
+                if len(batch) >= STREAMING_BATCH_SIZE:
+                    flush()
+            
+            if batch:
+                flush()
+        
+        self.logger.info(
+            f"Loaded {loaded_count} signatures, skipped {skipped_count} duplicates"
+        )
+        return loaded_count
+    
+    def _iter_streamed_rows(self, source: Path) -> Iterator[tuple]:
+        """Stream-parse a signature file and yield one insert row per entry.
+        
+        Only parsing and validation happen here, so errors raised while
+        inserting the rows are never reported as bad JSON.
+        
+        Args:
+            source: Path to JSON file containing signatures
+            
+        Yields:
+            (extension, magic_bytes, offset, description, mime_type) tuples
+            
+        Raises:
+            ValueError: If a signature entry is invalid or the JSON is malformed
+        """
+        try:
+            with open(source, 'rb') as f:
+                self._check_streaming_structure(f)
+                f.seek(0)
+                for i, sig in enumerate(ijson.items(f, 'signatures.item')):
+                    yield self._validated_row(i, sig)
+        except (ValueError, ijson.JSONError) as e:
+            error_msg = f"Invalid JSON structure in {source}: {e}"
+            self.logger.error(error_msg)
+            raise ValueError(error_msg) from None
+    
+    def _check_streaming_structure(self, f) -> None:
+        """Check the top-level structure of a streamed signature file.
+        
+        Applies the same root checks as _iter_validated_rows() using ijson
+        parse events, stopping as soon as the 'signatures' array starts.
+        
+        Args:
+            f: Binary file object positioned at the start of the document
+            
+        Raises:
+            ValueError: If the root is not an object or 'signatures' is
+                missing or not an array (also logged)
+        """
+        events = ijson.parse(f)
+        
+        _, event, _ = next(events)
+        if event != 'start_map':
+            raise self._structure_error("JSON root must be an object")
+        
+        for prefix, event, value in events:
+            if prefix != '':
+                continue
+            if event == 'map_key' and value == 'signatures':
+                _, event, _ = next(events)
+                if event != 'start_array':
+                    raise self._structure_error("'signatures' must be an array")
+                return
+            if event == 'end_map':
+                break
+        
+        raise self._structure_error("JSON must have 'signatures' array")
+    
+    def load_data(self, data: dict, database, source_name: str = "<data>") -> int:
+        """Load signatures from already-parsed JSON data into database.
+        
+        Args:
+            data: Parsed JSON data with a 'signatures' array
+            database: DatabaseProtocol instance to load into
+            source_name: Name of the data source used in log/error messages
+            
+        Returns:
+            Number of signatures successfully loaded
+            
+        Raises:
+            ValueError: If JSON structure is invalid
+        """
+        # Validate and build insert rows in a single pass over the entries
+        try:
+            rows = list(self._iter_validated_rows(data))
+        except ValueError:
+            error_msg = f"Invalid JSON structure in {source_name}"
             self.logger.error(error_msg)
-            raise ValueError(error_msg)
+            raise ValueError(error_msg) from None
+        
+        loaded_count, skipped_count = self._add_rows(rows, database)
+        
+        self.logger.info(
+            f"Loaded {loaded_count} signatures, skipped {skipped_count} duplicates"
+        )
+        return loaded_count
+    
+    def _add_rows(self, rows: list[tuple], database) -> tuple[int, int]:
+        """Insert validated rows, in one bulk transaction when supported.
+        
+        Args:
+            rows: Validated (extension, magic_bytes, offset, description,
+                mime_type) tuples
+            database: DatabaseProtocol instance to load into
+            
+        Returns:
+            Tuple of (loaded_count, skipped_count)
+        """
+        add_signatures = getattr(database, 'add_signatures', None)
+        if add_signatures is not None:
+            loaded_count = add_signatures(rows)
+            return loaded_count, len(rows) - loaded_count
         
-        # Load signatures
-        signatures = data.get('signatures', [])
+        return self._add_one_by_one(rows, database)
+    
+    def _add_one_by_one(self, rows: list[tuple], database) -> tuple[int, int]:
+        """Insert signatures individually via add_signature().
+        
+        Fallback for DatabaseProtocol implementations without a bulk
+        add_signatures() method.
+        
+        Args:
+            rows: Validated (extension, magic_bytes, offset, description,
+                mime_type) tuples
+            database: DatabaseProtocol instance to load into
+            
+        Returns:
+            Tuple of (loaded_count, skipped_count)
+        """
         loaded_count = 0
         skipped_count = 0
         
-        for sig_data in signatures:
+        for extension, magic_bytes, offset, description, mime_type in rows:
             try:
                 database.add_signature(
-                    extension=sig_data['extension'],
-                    magic_bytes=sig_data['magic_bytes'],
-                    offset=sig_data.get('offset', 0),
-                    description=sig_data.get('description'),
-                    mime_type=sig_data.get('mime_type'),
+                    extension=extension,
+                    magic_bytes=magic_bytes,
+                    offset=offset,
+                    description=description,
+                    mime_type=mime_type,
                 )
                 loaded_count += 1
                 
             except Exception as e:
                 # Skip duplicates and other errors
-                self.logger.debug(
-                    f"Skipped signature for '.{sig_data.get('extension', '?')}': {e}"
-                )
+                self.logger.debug(f"Skipped signature for '.{extension}': {e}")
                 skipped_count += 1
         
-        self.logger.info(
-            f"Loaded {loaded_count} signatures, skipped {skipped_count} duplicates"
-        )
-        return loaded_count
+        return loaded_count, skipped_count
     
     def validate_source(self, source_path: str) -> bool:
         """Validate JSON file structure.
         
+        Results are cached per file path, modification time and size, so
+        validating an unchanged file again does not re-parse it.
+        
         Args:
             source_path: Path to JSON file
             
@@ -99,11 +297,31 @@ class DataLoader:
             True if file has valid structure
         """
         try:
-            with open(source_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            return self._validate_structure(data)
-        except (json.JSONDecodeError, FileNotFoundError, IOError):
+            stat = os.stat(source_path)
+        except OSError:
+            return False
+        
+        key = (os.path.abspath(source_path), stat.st_mtime_ns, stat.st_size)
+        cached = self._validate_cache.get(key)
+        if cached is not None:
+            self._validate_cache.move_to_end(key)
+            return cached
+        
+        try:
+            data = _read_json(Path(source_path))
+        except JSONDecodeError:
+            result = False
+        except IOError:
+            # Not cached: permissions can change without touching mtime
             return False
+        else:
+            result = self._validate_structure(data)
+        
+        self._validate_cache[key] = result
+        if len(self._validate_cache) > VALIDATE_CACHE_SIZE:
+            self._validate_cache.popitem(last=False)
+        
+        return result
     
     def _validate_structure(self, data: dict) -> bool:
         """Validate JSON data structure.
@@ -114,48 +332,94 @@ class DataLoader:
         Returns:
             True if structure is valid
         """
+        try:
+            for _ in self._iter_validated_rows(data):
+                pass
+        except ValueError:
+            return False
+        
+        return True
+    
+    def _iter_validated_rows(self, data: dict) -> Iterator[tuple]:
+        """Validate JSON data and yield one insert row per signature.
+        
+        Args:
+            data: Parsed JSON data
+            
+        Yields:
+            (extension, magic_bytes, offset, description, mime_type) tuples
+            
+        Raises:
+            ValueError: On the first structural problem found (also logged)
+        """
         # Check top-level structure
         if not isinstance(data, dict):
-            self.logger.error("JSON root must be an object")
-            return False
+            raise self._structure_error("JSON root must be an object")
         
         if 'signatures' not in data:
-            self.logger.error("JSON must have 'signatures' array")
-            return False
+            raise self._structure_error("JSON must have 'signatures' array")
         
         signatures = data['signatures']
         if not isinstance(signatures, list):
-            self.logger.error("'signatures' must be an array")
-            return False
+            raise self._structure_error("'signatures' must be an array")
         
         # Validate each signature entry
         for i, sig in enumerate(signatures):
-            if not isinstance(sig, dict):
-                self.logger.error(f"Signature {i} must be an object")
-                return False
-            
-            required_fields = ['extension', 'magic_bytes']
-            for field in required_fields:
-                if field not in sig:
-                    self.logger.error(
-                        f"Signature {i} missing required field: {field}"
-                    )
-                    return False
-            
-            # Validate magic_bytes is hex string
-            try:
-                bytes.fromhex(sig['magic_bytes'])
-            except ValueError:
-                self.logger.error(
-                    f"Signature {i} has invalid magic_bytes (must be hex): "
-                    f"{sig['magic_bytes']}"
+            yield self._validated_row(i, sig)
+    
+    def _validated_row(self, index: int, sig: Any) -> tuple:
+        """Validate one signature entry and build its insert row.
+        
+        Args:
+            index: Position of the entry in the 'signatures' array
+            sig: Parsed signature entry
+            
+        Returns:
+            (extension, magic_bytes, offset, description, mime_type) tuple
+            
+        Raises:
+            ValueError: If the entry is invalid (also logged)
+        """
+        if not isinstance(sig, dict):
+            raise self._structure_error(f"Signature {index} must be an object")
+        
+        required_fields = ['extension', 'magic_bytes']
+        for field in required_fields:
+            if field not in sig:
+                raise self._structure_error(
+                    f"Signature {index} missing required field: {field}"
                 )
-                return False
         
-        return True
+        # Validate magic_bytes is hex string, accepting the same separators
+        # as the database (one C-level parse; also rejects odd lengths and
+        # non-string values)
+        try:
+            bytes.fromhex(normalize_magic_bytes(sig['magic_bytes']))
+        except (ValueError, TypeError, AttributeError):
+            raise self._structure_error(
+                f"Signature {index} has invalid magic_bytes (must be hex): "
+                f"{sig['magic_bytes']}"
+            ) from None
+        
+        return (
+            sig['extension'],
+            sig['magic_bytes'],
+            sig.get('offset', 0),
+            sig.get('description'),
+            sig.get('mime_type'),
+        )
+    
+    def _structure_error(self, message: str) -> ValueError:
+        """Log a structure problem and build the matching ValueError."""
+        self.logger.error(message)
+        return ValueError(message)
 
 
-def initialize_default_signatures(database, logger: Optional[logging.Logger] = None):
+def initialize_default_signatures(
+    database,
+    logger: Optional[logging.Logger] = None,
+    preloaded: Optional[dict] = None,
+):
     """Initialize database with default signatures if empty.
     
     Loads signatures from bundled data/signatures.json file if the database
@@ -164,6 +428,8 @@ def initialize_default_signatures(database, logger: Optional[logging.Logger] = N
     Args:
         database: DatabaseProtocol instance
         logger: LoggerProtocol instance. If None, creates logger for this module.
+        preloaded: Already-parsed signatures JSON. If given, it is loaded
+            directly and the signature file search is skipped.
         
     Returns:
         Number of signatures loaded, or 0 if database already populated
@@ -179,7 +445,36 @@ def initialize_default_signatures(database, logger: Optional[logging.Logger] = N
     except Exception as e:
         logger.warning(f"Could not check signature count: {e}")
     
+    if preloaded is not None:
+        loader = DataLoader(logger=logger)
+        return loader.load_data(preloaded, database, source_name="<preloaded>")
+    
     # Load from bundled file
+    sig_path = _find_default_signatures_file()
+    if sig_path is not None:
+        logger.info(f"Found signature file at: {sig_path}")
+        loader = DataLoader(logger=logger)
+        loaded = loader.load_signatures(str(sig_path), database)
+        return loaded
+    
+    logger.warning("No signature file found. Database will be empty.")
+    return 0
+
+
+def _find_default_signatures_file() -> Optional[Path]:
+    """Locate the bundled signatures.json file.
+    
+    The first hit is remembered, so later calls cost a single is_file()
+    check; the full search only runs again if that file disappears.
+    
+    Returns:
+        Path to the signature file, or None if none was found
+    """
+    global _default_signatures_path
+    
+    if _default_signatures_path is not None and _default_signatures_path.is_file():
+        return _default_signatures_path
+    
     # Try multiple possible locations
     possible_paths = [
         Path(__file__).parent.parent / "data" / "signatures.json",  # Packaged location
@@ -190,19 +485,19 @@ def initialize_default_signatures(database, logger: Optional[logging.Logger] = N
     
     for sig_path in possible_paths:
         if sig_path.exists():
-            logger.info(f"Found signature file at: {sig_path}")
-            loader = DataLoader(logger=logger)
-            loaded = loader.load_signatures(str(sig_path), database)
-            return loaded
+            _default_signatures_path = sig_path
+            return sig_path
     
-    logger.warning("No signature file found. Database will be empty.")
-    return 0
+    _default_signatures_path = None
+    return None
 
 
 def export_signatures_to_json(database, output_path: str, logger: Optional[logging.Logger] = None) -> int:
     """Export database signatures to JSON file.
     
-    Useful for backup, sharing, or migrating signatures.
+    Useful for backup, sharing, or migrating signatures. Signatures are
+    written as they are read, so memory use does not grow with the
+    number of signatures.
     
     Args:
         database: DatabaseProtocol instance
@@ -216,33 +511,77 @@ def export_signatures_to_json(database, output_path: str, logger: Optional[loggi
     
     logger.info(f"Exporting signatures to: {output_path}")
     
-    # Get all extensions
-    extensions = database.get_all_extensions()
-    
-    signatures_data = []
-    for ext in extensions:
-        sigs = database.get_signatures(ext)
-        for magic_hex, offset in sigs:
-            signatures_data.append({
-                "extension": ext,
-                "magic_bytes": magic_hex,
-                "offset": offset,
-            })
-    
-    # Create export data
-    export_data = {
-        "version": "1.0",
-        "description": "Exported signatures from MagicGuard",
-        "signatures": signatures_data
-    }
-    
-    # Write to file
+    # Write to file, one signature at a time
     output = Path(output_path)
     output.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output, 'w', encoding='utf-8') as f:
-        json.dump(export_data, f, indent=2, ensure_ascii=False)
+    # Write next to the destination and swap it in only once complete, so a
+    # failure part-way never leaves a truncated export in place
+    count = 0
+    tmp = tempfile.NamedTemporaryFile(
+        'wb', dir=output.parent, prefix=f".{output.name}.", suffix=".tmp", delete=False
+    )
+    try:
+        with tmp as f:
+            # Same bytes json.dump(indent=2) wrote for the whole document,
+            # produced one signature at a time
+            f.write(
+                b'{\n  "version": ' + dumps("1.0")
+                + b',\n  "description": ' + dumps("Exported signatures from MagicGuard")
+                + b',\n  "signatures": ['
+            )
+            for ext, magic_hex, offset in _iter_export_rows(database):
+                f.write(b',\n    ' if count else b'\n    ')
+                f.write(dumps({
+                    "extension": ext,
+                    "magic_bytes": magic_hex,
+                    "offset": offset,
+                }, indent=True).replace(b'\n', b'\n    '))
+                count += 1
+            f.write(b'\n  ]\n}' if count else b']\n}')
+        
+        # NamedTemporaryFile is private (0600); keep the previous export's
+        # mode, or the mode open() would give a new file
+        try:
+            mode = output.stat().st_mode & 0o777
+        except FileNotFoundError:
+            mode = _new_file_mode()
+        os.chmod(tmp.name, mode)
+        os.replace(tmp.name, output)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
     
-    count = len(signatures_data)
     logger.info(f"Exported {count} signatures to {output_path}")
     return count
+
+
+def _new_file_mode() -> int:
+    """Return the permission bits open() gives a newly created file.
+    
+    Returns:
+        0o666 with the process umask applied
+    """
+    # The umask can only be read by setting it, so put it straight back
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def _iter_export_rows(database) -> Iterator[tuple[str, str, int]]:
+    """Yield (extension, magic_bytes, offset) for every signature.
+    
+    Streams from the database cursor when it supports iter_signatures(),
+    otherwise walks get_all_extensions()/get_signatures().
+    
+    Args:
+        database: DatabaseProtocol instance
+    """
+    iter_signatures = getattr(database, 'iter_signatures', None)
+    if iter_signatures is not None:
+        yield from iter_signatures()
+        return
+    
+    for ext in database.get_all_extensions():
+        for magic_hex, offset in database.get_signatures(ext):
+            yield ext, magic_hex, offset
@@ -2,20 +2,34 @@
 
 This module provides a unified logging interface with support for:
 - Beautiful console output using Rich library
-- Daily rotating file logs
+- Daily rotating file logs (plain text or JSON lines)
 - Automatic cleanup of old log files
 - Thread-safe singleton pattern
 - Environment-based configuration
 
 The logger writes to both console (with colors) and daily log files stored
 in ~/.magicguard/log/ directory.
+
+Hot paths that build expensive debug messages can guard them so the f-string
+is never evaluated when DEBUG is off:
+
+    >>> from magicguard.utils import logger as log_module
+    >>> if log_module.DEBUG_ENABLED:
+    ...     logger.debug(f"Read signature: {signature.hex().upper()}")
+
+Code holding an injected logger should prefer
+``logger.isEnabledFor(logging.DEBUG)``, which honours that logger's own level.
 """
 
+import json
 import logging
+import os
 import sys
+import traceback
 from datetime import datetime, timedelta
+from functools import cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 from rich.console import Console
 from rich.logging import RichHandler
@@ -27,6 +41,49 @@ from magicguard.utils import config
 _loggers: dict[str, logging.Logger] = {}
 _initialized: bool = False
 
+# Whether the root logger emits DEBUG records; refreshed by setup_logging()
+DEBUG_ENABLED: bool = False
+
+
+class NDJSONHandler(logging.FileHandler):
+    """File handler writing one JSON object per line.
+    
+    Bypasses Formatter entirely: the record's epoch timestamp is written
+    as-is instead of being rendered through strftime, which is the largest
+    per-record cost of the text format. Each line has the keys ``t``
+    (created time), ``l`` (level), ``n`` (logger name), ``m`` (message)
+    and, when exception info is attached, ``x`` (formatted traceback).
+    """
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write the record as a single JSON line."""
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            
+            line = (
+                f'{{"t":{record.created:.3f},"l":{json.dumps(record.levelname)},'
+                f'"n":{json.dumps(record.name)},"m":{json.dumps(record.getMessage())}'
+            )
+            if record.exc_info:
+                exc_text = "".join(traceback.format_exception(*record.exc_info))
+                line += f',"x":{json.dumps(exc_text)}'
+            
+            self.stream.write(line + "}\n")
+            self.flush()
+        except Exception:
+            self.handleError(record)
+
+
+@cache
+def _file_formatter() -> logging.Formatter:
+    """Return the shared formatter used by all file handlers.
+    
+    Built lazily on first use so config overrides applied before logging
+    is set up are honoured, then reused by every file handler.
+    """
+    return logging.Formatter(fmt=config.LOG_FORMAT, datefmt=config.LOG_DATE_FORMAT)
+
 
 def setup_logging(
     level: Optional[str] = None, log_dir: Optional[Path] = None
@@ -46,7 +103,7 @@ def setup_logging(
         >>> logger = get_logger(__name__)
         >>> logger.info("Application started")
     """
-    global _initialized
+    global _initialized, DEBUG_ENABLED
     
     if _initialized:
         return
@@ -70,7 +127,7 @@ def setup_logging(
     console_handler = RichHandler(
         console=console,
         rich_tracebacks=True,
-        tracebacks_show_locals=True,
+        tracebacks_show_locals=False,  # Capturing locals is slow and noisy
         show_time=True,
         show_path=True,
     )
@@ -79,19 +136,18 @@ def setup_logging(
     
     # File handler with daily rotation
     log_file = log_directory / datetime.now().strftime(config.LOG_FILE_FORMAT)
-    file_handler = logging.FileHandler(log_file, mode="a", encoding="utf-8")
+    handler_class = NDJSONHandler if config.get_log_ndjson() else logging.FileHandler
+    file_handler = handler_class(log_file, mode="a", encoding="utf-8")
     file_handler.setLevel(getattr(logging, log_level))
     
     # Detailed format for file logs
-    file_formatter = logging.Formatter(
-        fmt=config.LOG_FORMAT, datefmt=config.LOG_DATE_FORMAT
-    )
-    file_handler.setFormatter(file_formatter)
+    file_handler.setFormatter(_file_formatter())
     root_logger.addHandler(file_handler)
     
     # Cleanup old log files
     cleanup_old_logs(log_directory, config.MAX_LOG_FILES)
     
+    DEBUG_ENABLED = root_logger.isEnabledFor(logging.DEBUG)
     _initialized = True
     
     # Log initialization
@@ -137,14 +193,59 @@ def get_logger(name: str) -> logging.Logger:
     return logger
 
 
-def cleanup_old_logs(log_dir: Path, max_days: int = 30) -> int:
+def logger_for(name: str, level: Union[int, str]) -> logging.Logger:
+    """Get a logger for the given module with an explicit level.
+    
+    Setting the level on the logger itself makes ``isEnabledFor`` reject
+    records below it before any handler work is done. Levels above CRITICAL
+    (e.g. ``logging.CRITICAL + 1``, used by tests to silence output) also
+    mark the logger as disabled so every call returns immediately.
+    
+    Note:
+        Loggers are cached per name by the logging module, so the level and
+        disabled flag apply to every holder of ``name`` for the rest of the
+        process, not just to the returned reference. Pass a dedicated
+        (e.g. child) name to change the level for one caller only.
+    
+    Args:
+        name: Logger name, typically __name__ of the calling module
+        level: Log level as int or name (DEBUG, INFO, ...)
+        
+    Returns:
+        Configured Logger instance
+        
+    Raises:
+        ValueError: If level is not a known level name or an int
+        
+    Example:
+        >>> logger = logger_for(__name__, "WARNING")
+        >>> logger.isEnabledFor(logging.DEBUG)
+        False
+    """
+    if isinstance(level, str):
+        levels = logging.getLevelNamesMapping()
+        if level.upper() not in levels:
+            raise ValueError(f"Unknown log level: {level!r}")
+        level = levels[level.upper()]
+    elif not isinstance(level, int) or isinstance(level, bool):
+        raise ValueError(f"Log level must be an int or level name, got {level!r}")
+    
+    logger = get_logger(name)
+    logger.setLevel(level)
+    logger.disabled = level > logging.CRITICAL
+    
+    return logger
+
+
+def cleanup_old_logs(log_dir: Union[str, Path], max_days: int = 30) -> int:
     """Remove log files older than specified number of days.
     
     Scans the log directory for log files matching the date format pattern
-    and removes any that are older than max_days.
+    and removes any that are older than max_days. Uses ``os.scandir`` and
+    plain string paths so no Path objects are allocated per file.
     
     Args:
-        log_dir: Directory containing log files
+        log_dir: Directory containing log files (str or Path)
         max_days: Maximum age of log files to keep (default: 30 days)
         
     Returns:
@@ -154,38 +255,43 @@ def cleanup_old_logs(log_dir: Path, max_days: int = 30) -> int:
         >>> cleanup_old_logs(Path("~/.magicguard/log"), max_days=30)
         3  # Deleted 3 old log files
     """
-    if not log_dir.exists():
+    log_dir = os.fspath(log_dir)
+    if not os.path.isdir(log_dir):
         return 0
     
     deleted_count = 0
     cutoff_date = datetime.now() - timedelta(days=max_days)
     
     # Find all log files matching the date pattern
-    for log_file in log_dir.glob("*.log"):
-        try:
-            # Extract date from filename (YYYY-MM-DD.log)
-            filename = log_file.stem  # Remove .log extension
-            file_date = datetime.strptime(filename, "%Y-%m-%d")
+    with os.scandir(log_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".log"):
+                continue
             
-            if file_date < cutoff_date:
-                log_file.unlink()
-                deleted_count += 1
+            try:
+                # Extract date from filename (YYYY-MM-DD.log)
+                filename = entry.name[:-len(".log")]
+                file_date = datetime.strptime(filename, "%Y-%m-%d")
                 
-        except (ValueError, OSError):
-            # Skip files that don't match expected format or can't be deleted
-            continue
+                if file_date < cutoff_date:
+                    os.unlink(entry.path)
+                    deleted_count += 1
+                    
+            except (ValueError, OSError):
+                # Skip files that don't match expected format or can't be deleted
+                continue
     
     return deleted_count
 
 
-def rotate_log_file_if_needed(log_dir: Path) -> None:
+def rotate_log_file_if_needed(log_dir: Union[str, Path]) -> None:
     """Check if a new log file is needed for today.
     
     If the current log file is from a previous day, this function will
     trigger the creation of a new log file for today.
     
     Args:
-        log_dir: Directory containing log files
+        log_dir: Directory containing log files (str or Path)
     """
     # Get current root logger handlers
     root_logger = logging.getLogger()
@@ -200,25 +306,27 @@ def rotate_log_file_if_needed(log_dir: Path) -> None:
     if not file_handler:
         return
     
-    # Check if current log file matches today's date
-    current_file = Path(file_handler.baseFilename)
-    expected_file = log_dir / datetime.now().strftime(config.LOG_FILE_FORMAT)
+    # Check if current log file matches today's date. baseFilename is already
+    # an absolute str, so compare strings rather than building Path objects.
+    expected_file = os.path.abspath(
+        os.path.join(log_dir, datetime.now().strftime(config.LOG_FILE_FORMAT))
+    )
     
-    if current_file != expected_file:
-        # Close current handler
-        file_handler.close()
-        root_logger.removeHandler(file_handler)
-        
-        # Create new handler for today
-        new_handler = logging.FileHandler(
-            expected_file, mode="a", encoding="utf-8"
+    if file_handler.baseFilename != expected_file:
+        # Create new handler for today, keeping the same output format. Other
+        # FileHandler subclasses may not share FileHandler's signature, so
+        # only the two classes setup_logging() uses are constructed.
+        handler_class = (
+            NDJSONHandler if isinstance(file_handler, NDJSONHandler)
+            else logging.FileHandler
         )
+        new_handler = handler_class(expected_file, mode="a", encoding="utf-8")
         new_handler.setLevel(file_handler.level)
+        new_handler.setFormatter(_file_formatter())
         
-        file_formatter = logging.Formatter(
-            fmt=config.LOG_FORMAT, datefmt=config.LOG_DATE_FORMAT
-        )
-        new_handler.setFormatter(file_formatter)
+        # Swap handlers only once the new one exists
+        file_handler.close()
+        root_logger.removeHandler(file_handler)
         root_logger.addHandler(new_handler)
 
 
@@ -0,0 +1,28 @@
+"""Shared pytest configuration for the MagicGuard test suite."""
+
+import os
+import sys
+import tempfile
+
+# Set to 1 to keep pytest's temporary directories on /dev/shm
+ENV_TEST_TMPFS = "MAGICGUARD_TEST_TMPFS"
+
+
+def pytest_configure(config):
+    """Keep pytest's temporary directories on tmpfs when asked to.
+
+    Database tests create and delete many small SQLite files (plus their
+    WAL/SHM companions). On Linux, /dev/shm turns those writes, fsyncs and
+    unlinks into memory operations. This is opt-in because /dev/shm is
+    often small (64MB by default in Docker containers) and pytest keeps
+    recent temporary directories around. An explicit TMPDIR or --basetemp
+    still takes precedence.
+    """
+    if (
+        os.environ.get(ENV_TEST_TMPFS) == "1"
+        and sys.platform == "linux"
+        and "TMPDIR" not in os.environ
+        and config.option.basetemp is None
+        and os.access("/dev/shm", os.W_OK)
+    ):
+        tempfile.tempdir = "/dev/shm"
@@ -3,43 +3,68 @@
 Tests Click command-line interface using CliRunner for isolated testing.
 """
 
+import logging
+import shutil
+
 import pytest
 from pathlib import Path
 from click.testing import CliRunner
 
 from magicguard.cli.commands import cli, scan, scan_dir, list_signatures, status
 from magicguard.core.database import Database
+from magicguard.utils.logger import setup_logging
 
 
-@pytest.fixture
+@pytest.fixture(scope="module", autouse=True)
+def quiet_logging():
+    """Initialize logging once and silence it for the CLI tests.
+    
+    setup_logging() runs first so lazy initialization can't reset the
+    root level mid-test; the previous level is restored afterwards.
+    """
+    setup_logging(level="CRITICAL")
+    root_logger = logging.getLogger()
+    previous_level = root_logger.level
+    root_logger.setLevel(logging.CRITICAL)
+    yield
+    root_logger.setLevel(previous_level)
+
+
+@pytest.fixture(scope="session")
 def runner():
-    """Provide Click CLI test runner."""
+    """Provide a shared Click CLI test runner.
+    
+    CliRunner keeps no per-invocation state, so one instance serves
+    every test.
+    """
     return CliRunner()
 
 
-@pytest.fixture
-def temp_pdf(tmp_path):
-    """Create a temporary valid PDF file."""
-    pdf_file = tmp_path / "test.pdf"
+@pytest.fixture(scope="session")
+def temp_pdf(tmp_path_factory):
+    """Create a temporary valid PDF file (shared, read-only)."""
+    pdf_file = tmp_path_factory.mktemp("pdf") / "test.pdf"
     # Valid PDF signature
     pdf_file.write_bytes(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
     return pdf_file
 
 
-@pytest.fixture
-def temp_fake_pdf(tmp_path):
+@pytest.fixture(scope="session")
+def temp_fake_pdf(tmp_path_factory):
     """Create a spoofed PDF (PNG signature with .pdf extension)."""
-    fake_pdf = tmp_path / "fake.pdf"
+    fake_pdf = tmp_path_factory.mktemp("fake_pdf") / "fake.pdf"
     # PNG signature
     fake_pdf.write_bytes(b"\x89PNG\r\n\x1a\n")
     return fake_pdf
 
 
-@pytest.fixture
-def temp_directory(tmp_path):
-    """Create a directory with multiple test files."""
-    test_dir = tmp_path / "test_files"
-    test_dir.mkdir()
+@pytest.fixture(scope="session")
+def temp_directory(tmp_path_factory):
+    """Create a directory with multiple test files (shared, read-only).
+    
+    Tests that add files must use ``mutable_temp_directory`` instead.
+    """
+    test_dir = tmp_path_factory.mktemp("test_files")
     
     # Valid PDF
     (test_dir / "document.pdf").write_bytes(b"%PDF-1.4\n")
@@ -53,6 +78,14 @@ def temp_directory(tmp_path):
     return test_dir
 
 
+@pytest.fixture
+def mutable_temp_directory(temp_directory, tmp_path):
+    """Provide a per-test copy of temp_directory that may be modified."""
+    test_dir = tmp_path / "test_files"
+    shutil.copytree(temp_directory, test_dir)
+    return test_dir
+
+
 class TestCLIBasics:
     """Test basic CLI functionality."""
     
@@ -142,14 +175,14 @@ class TestScanDirCommand:
         # Command should execute (exit code 0 or 1 for validation failures is OK)
         assert result.exit_code in [0, 1]
     
-    def test_scan_dir_recursive(self, runner, temp_directory):
+    def test_scan_dir_recursive(self, runner, mutable_temp_directory):
         """Test recursive directory scanning."""
         # Create subdirectory
-        subdir = temp_directory / "subdir"
+        subdir = mutable_temp_directory / "subdir"
         subdir.mkdir()
         (subdir / "nested.pdf").write_bytes(b"%PDF-1.4\n")
         
-        result = runner.invoke(scan_dir, [str(temp_directory), '--recursive'])
+        result = runner.invoke(scan_dir, [str(mutable_temp_directory), '--recursive'])
         assert result.exit_code in [0, 1]
     
     def test_scan_dir_with_extensions(self, runner, temp_directory):
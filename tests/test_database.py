@@ -13,7 +13,6 @@ Tests cover:
 
 import sqlite3
 from pathlib import Path
-from unittest.mock import MagicMock
 
 import pytest
 
@@ -21,28 +20,129 @@ from magicguard.core.database import Database
 from magicguard.core.exceptions import DatabaseError, SignatureNotFoundError
 
 
+class RecordingLogger:
+    """Minimal logger stand-in that records (level, message) calls."""
+    
+    def __init__(self):
+        self.calls = []
+    
+    def debug(self, msg, *args, **kwargs):
+        self.calls.append(("debug", msg))
+    
+    def info(self, msg, *args, **kwargs):
+        self.calls.append(("info", msg))
+    
+    def warning(self, msg, *args, **kwargs):
+        self.calls.append(("warning", msg))
+    
+    def error(self, msg, *args, **kwargs):
+        self.calls.append(("error", msg))
+    
+    def critical(self, msg, *args, **kwargs):
+        self.calls.append(("critical", msg))
+
+
 @pytest.fixture
 def temp_db_path(tmp_path):
     """Provide temporary database path."""
     return tmp_path / "test_signatures.db"
 
 
+@pytest.fixture(scope="module")
+def template_database():
+    """Provide an empty in-memory database built once per module."""
+    with Database(db_path=":memory:") as db:
+        yield db
+
+
 @pytest.fixture
-def database(temp_db_path):
-    """Provide a fresh Database instance for each test."""
+def database(temp_db_path, template_database):
+    """Provide a fresh Database instance for each test.
+    
+    The file is cloned from the in-memory template with the SQLite backup
+    API, so the schema is already in place when Database opens it.
+    """
+    target = sqlite3.connect(str(temp_db_path))
+    try:
+        template_database.conn.backup(target)
+    finally:
+        target.close()
+    
     db = Database(db_path=str(temp_db_path))
     yield db
     db.close()
 
 
+@pytest.fixture(scope="session")
+def shared_database():
+    """Provide one in-memory Database for tests that never write to it."""
+    with Database(db_path=":memory:") as db:
+        yield db
+
+
+@pytest.fixture(scope="module")
+def closed_database():
+    """Provide a database whose connection has already been closed."""
+    db = Database(db_path=":memory:")
+    db.close()
+    return db
+
+
+@pytest.fixture
+def memory_database():
+    """Provide a fresh in-memory Database for tests that need no file."""
+    with Database(db_path=":memory:") as db:
+        yield db
+
+
+@pytest.fixture(scope="session")
+def seeded_template():
+    """Provide an in-memory database seeded with test signatures once."""
+    with Database(db_path=":memory:") as db:
+        db.add_signatures([
+            ("pdf", "25504446", 0, "PDF document", "application/pdf"),
+            ("png", "89504E47", 0, "PNG image", "image/png"),
+            ("jpg", "FFD8FFE0", 0, "JPEG image", "image/jpeg"),
+            ("zip", "504B0304", 0, "ZIP archive", "application/zip"),
+        ])
+        yield db
+
+
 @pytest.fixture
-def populated_database(database):
-    """Provide a database with test signatures."""
-    database.add_signature("pdf", "25504446", 0, "PDF document", "application/pdf")
-    database.add_signature("png", "89504E47", 0, "PNG image", "image/png")
-    database.add_signature("jpg", "FFD8FFE0", 0, "JPEG image", "image/jpeg")
-    database.add_signature("zip", "504B0304", 0, "ZIP archive", "application/zip")
-    return database
+def populated_database(memory_database, seeded_template):
+    """Provide an in-memory database with test signatures.
+    
+    The seeded rows are copied from the session template with the SQLite
+    backup API instead of being inserted again for every test.
+    """
+    seeded_template.conn.backup(memory_database.conn)
+    return memory_database
+
+
+@pytest.fixture
+def legacy_db_path(temp_db_path):
+    """Provide a database file as older releases created it.
+    
+    It uses the default rollback journal and still carries idx_extension.
+    """
+    conn = sqlite3.connect(str(temp_db_path))
+    conn.executescript("""
+        CREATE TABLE signatures (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            extension TEXT NOT NULL,
+            magic_bytes TEXT NOT NULL,
+            offset INTEGER DEFAULT 0,
+            description TEXT,
+            mime_type TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(extension, magic_bytes, offset)
+        );
+        CREATE INDEX idx_extension ON signatures(extension);
+        INSERT INTO signatures (extension, magic_bytes, offset)
+            VALUES ('pdf', '25504446', 0);
+    """)
+    conn.close()
+    return temp_db_path
 
 
 class TestDatabaseInitialization:
@@ -61,18 +161,17 @@ class TestDatabaseInitialization:
         """Test that database schema is created correctly."""
         db = Database(db_path=str(temp_db_path))
         
-        # Verify table exists with correct schema
-        cursor = db.conn.cursor()
-        cursor.execute(
-            "SELECT sql FROM sqlite_master WHERE type='table' AND name='signatures'"
-        )
-        schema = cursor.fetchone()[0]
+        # Verify table exists with correct columns: (type, notnull, default)
+        columns = {
+            row["name"]: (row["type"], row["notnull"], row["dflt_value"])
+            for row in db.conn.execute("PRAGMA table_info(signatures)")
+        }
         
-        assert "extension TEXT NOT NULL" in schema
-        assert "magic_bytes TEXT NOT NULL" in schema
-        assert "offset INTEGER DEFAULT 0" in schema
-        assert "description TEXT" in schema
-        assert "mime_type TEXT" in schema
+        assert columns["extension"] == ("TEXT", 1, None)
+        assert columns["magic_bytes"] == ("TEXT", 1, None)
+        assert columns["offset"] == ("INTEGER", 0, "0")
+        assert columns["description"] == ("TEXT", 0, None)
+        assert columns["mime_type"] == ("TEXT", 0, None)
         
         db.close()
     
@@ -98,104 +197,204 @@ class TestDatabaseInitialization:
         assert count == 1
         db.close()
     
+    def test_database_uses_wal_journal(self, database):
+        """Test that file databases are opened in WAL mode."""
+        cursor = database.conn.cursor()
+        
+        assert cursor.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert cursor.execute("PRAGMA synchronous").fetchone()[0] == 1
+    
+    def test_open_existing_database_while_locked(self, temp_db_path):
+        """Test that opening an up-to-date database does not need the write lock."""
+        Database(db_path=str(temp_db_path)).close()
+        
+        writer = sqlite3.connect(str(temp_db_path), isolation_level=None)
+        writer.execute("BEGIN IMMEDIATE")
+        try:
+            with Database(db_path=str(temp_db_path)) as db:
+                assert db.signature_count() == 0
+        finally:
+            writer.execute("ROLLBACK")
+            writer.close()
+    
+    def test_open_read_only_database(self, legacy_db_path, monkeypatch):
+        """Test that a read-only legacy database can still be opened and queried."""
+        connect = sqlite3.connect
+        monkeypatch.setattr(
+            sqlite3, "connect",
+            lambda path, **kwargs: connect(f"file:{path}?mode=ro", uri=True, **kwargs),
+        )
+        
+        with Database(db_path=str(legacy_db_path)) as db:
+            assert db.get_signatures("pdf") == [("25504446", 0)]
+    
+    def test_drops_legacy_extension_index(self, legacy_db_path):
+        """Test that the redundant idx_extension of older databases is removed."""
+        with Database(db_path=str(legacy_db_path)) as db:
+            indexes = db.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            ).fetchall()
+        
+        assert "idx_extension" not in [row["name"] for row in indexes]
+    
+    def test_database_in_memory(self):
+        """Test that ':memory:' databases work without touching the filesystem."""
+        db = Database(db_path=":memory:")
+        
+        db.add_signature("pdf", "25504446", 0)
+        
+        assert db.signature_count() == 1
+        db.close()
+    
     def test_database_with_custom_logger(self, temp_db_path):
         """Test database initialization with custom logger."""
-        mock_logger = MagicMock()
+        recorder = RecordingLogger()
         
-        db = Database(db_path=str(temp_db_path), logger=mock_logger)
+        db = Database(db_path=str(temp_db_path), logger=recorder)
         
-        assert db.logger == mock_logger
-        mock_logger.debug.assert_called()
+        assert db.logger is recorder
+        assert any(level == "debug" for level, _ in recorder.calls)
         db.close()
 
 
 class TestAddSignature:
     """Test adding signatures to database."""
     
-    def test_add_signature_basic(self, database):
+    def test_add_signature_basic(self, memory_database):
         """Test adding a basic signature."""
-        database.add_signature("pdf", "25504446", 0)
+        memory_database.add_signature("pdf", "25504446", 0)
         
-        count = database.signature_count()
+        count = memory_database.signature_count()
         assert count == 1
     
-    def test_add_signature_with_description(self, database):
+    def test_add_signature_with_description(self, memory_database):
         """Test adding signature with description."""
-        database.add_signature(
+        memory_database.add_signature(
             "pdf", "25504446", 0, 
             description="PDF document",
             mime_type="application/pdf"
         )
         
-        signatures = database.get_signatures("pdf")
+        signatures = memory_database.get_signatures("pdf")
         assert len(signatures) == 1
         assert signatures[0] == ("25504446", 0)
     
-    def test_add_signature_with_offset(self, database):
+    def test_add_signature_with_offset(self, memory_database):
         """Test adding signature with non-zero offset."""
-        database.add_signature("tar", "7573746172", 257)
+        memory_database.add_signature("tar", "7573746172", 257)
         
-        signatures = database.get_signatures("tar")
+        signatures = memory_database.get_signatures("tar")
         assert signatures[0] == ("7573746172", 257)
     
-    def test_add_signature_normalizes_extension(self, database):
+    def test_add_signature_normalizes_extension(self, memory_database):
         """Test that extensions are normalized (lowercase, no dot)."""
-        database.add_signature(".PDF", "25504446", 0)
-        database.add_signature("PNG", "89504E47", 0)
+        memory_database.add_signature(".PDF", "25504446", 0)
+        memory_database.add_signature("PNG", "89504E47", 0)
         
         # Should be able to retrieve with normalized names
-        pdf_sigs = database.get_signatures("pdf")
-        png_sigs = database.get_signatures("png")
+        pdf_sigs = memory_database.get_signatures("pdf")
+        png_sigs = memory_database.get_signatures("png")
         
         assert len(pdf_sigs) == 1
         assert len(png_sigs) == 1
     
-    def test_add_signature_normalizes_magic_bytes(self, database):
+    def test_add_signature_normalizes_magic_bytes(self, memory_database):
         """Test that magic bytes are normalized (uppercase, no spaces)."""
-        database.add_signature("test", "aa bb cc dd", 0)
+        memory_database.add_signature("test", "aa bb cc dd", 0)
         
-        signatures = database.get_signatures("test")
+        signatures = memory_database.get_signatures("test")
         assert signatures[0] == ("AABBCCDD", 0)
     
-    def test_add_duplicate_signature_raises_error(self, database):
+    def test_add_signature_strips_hex_separators(self, memory_database):
+        """Test that dash, colon and tab separators are dropped from magic bytes."""
+        memory_database.add_signature("test", "aa-bb:cc\tdd", 0)
+        
+        signatures = memory_database.get_signatures("test")
+        assert signatures[0] == ("AABBCCDD", 0)
+    
+    def test_add_duplicate_signature_raises_error(self, memory_database):
         """Test that adding duplicate signature raises DatabaseError."""
-        database.add_signature("pdf", "25504446", 0)
+        memory_database.add_signature("pdf", "25504446", 0)
         
         with pytest.raises(DatabaseError) as exc_info:
-            database.add_signature("pdf", "25504446", 0)
+            memory_database.add_signature("pdf", "25504446", 0)
         
         assert "already exists" in str(exc_info.value)
     
-    def test_add_multiple_signatures_same_extension(self, database):
+    def test_add_multiple_signatures_same_extension(self, memory_database):
         """Test adding multiple signatures for same extension."""
-        database.add_signature("jpg", "FFD8FFE0", 0)
-        database.add_signature("jpg", "FFD8FFE1", 0)
+        memory_database.add_signature("jpg", "FFD8FFE0", 0)
+        memory_database.add_signature("jpg", "FFD8FFE1", 0)
         
-        signatures = database.get_signatures("jpg")
+        signatures = memory_database.get_signatures("jpg")
         assert len(signatures) == 2
         assert ("FFD8FFE0", 0) in signatures
         assert ("FFD8FFE1", 0) in signatures
     
-    def test_add_signature_empty_extension(self, database):
-        """Test that empty extension is rejected."""
+    @pytest.mark.parametrize(
+        "extension, magic_bytes, message",
+        [
+            ("", "25504446", "Extension cannot be empty"),
+            ("pdf", "", "Magic bytes cannot be empty"),
+            ("test", "GGHHII", "Invalid hex string"),
+            (123, "25504446", "must be strings"),
+            ("pdf", None, "must be strings"),
+        ],
+        ids=[
+            "empty-extension", "empty-magic-bytes", "invalid-hex",
+            "non-string-extension", "non-string-magic-bytes",
+        ],
+    )
+    def test_add_signature_validation(
+        self, shared_database, extension, magic_bytes, message
+    ):
+        """Test that invalid input is rejected before anything is written."""
         with pytest.raises(DatabaseError) as exc_info:
-            database.add_signature("", "25504446", 0)
+            shared_database.add_signature(extension, magic_bytes, 0)
         
-        assert "Extension cannot be empty" in str(exc_info.value)
-    
-    def test_add_signature_empty_magic_bytes(self, database):
-        """Test that empty magic bytes is rejected."""
-        with pytest.raises(DatabaseError) as exc_info:
-            database.add_signature("pdf", "", 0)
-        
-        assert "Magic bytes cannot be empty" in str(exc_info.value)
-    
-    def test_add_signature_invalid_hex(self, database):
-        """Test that invalid hex string is rejected."""
-        with pytest.raises(DatabaseError) as exc_info:
-            database.add_signature("test", "GGHHII", 0)
-        
-        assert "Invalid hex string" in str(exc_info.value)
+        assert message in str(exc_info.value)
+        assert shared_database.signature_count() == 0
+
+
+class TestAddSignatures:
+    """Test bulk signature insertion."""
+    
+    def test_add_signatures_basic(self, memory_database):
+        """Test adding several signatures at once."""
+        inserted = memory_database.add_signatures([
+            ("pdf", "25504446", 0, "PDF document", "application/pdf"),
+            ("png", "89504E47", 0, "PNG image", None),
+        ])
+        
+        assert inserted == 2
+        assert memory_database.signature_count() == 2
+    
+    def test_add_signatures_normalizes_input(self, memory_database):
+        """Test that bulk input is normalized like add_signature."""
+        memory_database.add_signatures([(".PDF", "25 50 44 46", 0, None, None)])
+        
+        assert memory_database.get_signatures("pdf") == [("25504446", 0)]
+    
+    def test_add_signatures_ignores_duplicates(self, populated_database):
+        """Test that existing signatures are skipped, not raised."""
+        inserted = populated_database.add_signatures([
+            ("pdf", "25504446", 0, None, None),
+            ("gif", "47494638", 0, None, None),
+        ])
+        
+        assert inserted == 1
+        assert populated_database.signature_count() == 5
+    
+    def test_add_signatures_skips_invalid(self, memory_database):
+        """Test that invalid entries are skipped without aborting the batch."""
+        inserted = memory_database.add_signatures([
+            ("", "25504446", 0, None, None),
+            ("test", "GGHHII", 0, None, None),
+            ("png", "89504E47", 0, None, None),
+        ])
+        
+        assert inserted == 1
+        assert memory_database.get_all_extensions() == ["png"]
 
 
 class TestGetSignatures:
@@ -225,10 +424,22 @@ class TestGetSignatures:
         
         assert signatures_lower == signatures_upper == signatures_dot
     
-    def test_get_signatures_not_found(self, database):
+    def test_get_signatures_uses_covering_index(self, memory_database):
+        """Test that extension lookups are answered from an index alone."""
+        plan = memory_database.conn.execute(
+            "EXPLAIN QUERY PLAN "
+            "SELECT magic_bytes, offset FROM signatures WHERE extension = ? "
+            "ORDER BY magic_bytes, offset",
+            ("pdf",),
+        ).fetchall()
+        
+        assert "COVERING INDEX" in plan[0]["detail"]
+        assert not any("TEMP B-TREE" in row["detail"] for row in plan)
+    
+    def test_get_signatures_not_found(self, memory_database):
         """Test that SignatureNotFoundError is raised for unknown extension."""
         with pytest.raises(SignatureNotFoundError) as exc_info:
-            database.get_signatures("unknown")
+            memory_database.get_signatures("unknown")
         
         assert "No signature found" in str(exc_info.value)
         assert "unknown" in str(exc_info.value)
@@ -242,12 +453,62 @@ class TestGetSignatures:
         assert len(signatures[0]) == 2
 
 
+class TestGetSignaturesMulti:
+    """Test retrieving signatures for several extensions at once."""
+    
+    def test_get_signatures_multi(self, populated_database):
+        """Test retrieving signatures for several extensions in one call."""
+        populated_database.add_signature("jpg", "FFD8FFE1", 0)
+        # Inserted last but sorts first, so insertion order would differ
+        populated_database.add_signature("jpg", "FFD8FFDB", 0)
+        
+        signatures = populated_database.get_signatures_multi(["pdf", ".JPG"])
+        
+        assert signatures == {
+            "pdf": [("25504446", 0)],
+            "jpg": [("FFD8FFDB", 0), ("FFD8FFE0", 0), ("FFD8FFE1", 0)],
+        }
+        assert signatures["jpg"] == populated_database.get_signatures("jpg")
+    
+    def test_get_signatures_multi_skips_unknown(self, populated_database):
+        """Test that unknown extensions are left out instead of raising."""
+        signatures = populated_database.get_signatures_multi(["png", "nonexistent"])
+        
+        assert signatures == {"png": [("89504E47", 0)]}
+    
+    def test_get_signatures_multi_empty(self, memory_database):
+        """Test that no extensions gives an empty result."""
+        assert memory_database.get_signatures_multi([]) == {}
+
+
+class TestIterSignatures:
+    """Test streaming over all signatures."""
+    
+    def test_iter_signatures_empty(self, memory_database):
+        """Test iterating an empty database yields nothing."""
+        assert list(memory_database.iter_signatures()) == []
+    
+    def test_iter_signatures_ordered_by_extension(self, populated_database):
+        """Test that rows come back ordered by extension, then insertion."""
+        populated_database.add_signature("jpg", "FFD8FFE1", 0)
+        
+        rows = list(populated_database.iter_signatures())
+        
+        assert rows == [
+            ("jpg", "FFD8FFE0", 0),
+            ("jpg", "FFD8FFE1", 0),
+            ("pdf", "25504446", 0),
+            ("png", "89504E47", 0),
+            ("zip", "504B0304", 0),
+        ]
+
+
 class TestGetAllExtensions:
     """Test getting all extensions from database."""
     
-    def test_get_all_extensions_empty(self, database):
+    def test_get_all_extensions_empty(self, memory_database):
         """Test getting extensions from empty database."""
-        extensions = database.get_all_extensions()
+        extensions = memory_database.get_all_extensions()
         
         assert extensions == []
     
@@ -280,9 +541,9 @@ class TestGetAllExtensions:
 class TestSignatureCount:
     """Test signature counting."""
     
-    def test_signature_count_empty(self, database):
+    def test_signature_count_empty(self, memory_database):
         """Test count for empty database."""
-        count = database.signature_count()
+        count = memory_database.signature_count()
         
         assert count == 0
     
@@ -292,26 +553,106 @@ class TestSignatureCount:
         
         assert count == 4
     
-    def test_signature_count_after_additions(self, database):
+    def test_signature_count_after_additions(self, memory_database):
         """Test count updates after adding signatures."""
-        assert database.signature_count() == 0
+        assert memory_database.signature_count() == 0
         
-        database.add_signature("pdf", "25504446", 0)
-        assert database.signature_count() == 1
+        memory_database.add_signature("pdf", "25504446", 0)
+        assert memory_database.signature_count() == 1
         
-        database.add_signature("png", "89504E47", 0)
-        assert database.signature_count() == 2
+        memory_database.add_signature("png", "89504E47", 0)
+        assert memory_database.signature_count() == 2
     
-    def test_signature_count_includes_multiple_per_extension(self, database):
+    def test_signature_count_includes_multiple_per_extension(self, memory_database):
         """Test that count includes all signatures, not just extensions."""
-        database.add_signature("jpg", "FFD8FFE0", 0)
-        database.add_signature("jpg", "FFD8FFE1", 0)
+        memory_database.add_signature("jpg", "FFD8FFE0", 0)
+        memory_database.add_signature("jpg", "FFD8FFE1", 0)
         
-        count = database.signature_count()
+        count = memory_database.signature_count()
         
         assert count == 2
 
 
+class TestTruncateSignatures:
+    """Test removing all signatures."""
+    
+    def test_truncate_signatures(self, populated_database):
+        """Test that truncate removes every signature and reports the count."""
+        removed = populated_database.truncate_signatures()
+        
+        assert removed == 4
+        assert populated_database.signature_count() == 0
+    
+    def test_truncate_keeps_schema(self, populated_database):
+        """Test that database is usable after truncation."""
+        populated_database.truncate_signatures()
+        
+        populated_database.add_signature("pdf", "25504446", 0)
+        
+        assert populated_database.get_signatures("pdf") == [("25504446", 0)]
+
+
+class TestTransaction:
+    """Test explicit write transactions."""
+    
+    def test_transaction_commits(self, database):
+        """Test that writes inside a transaction are committed together."""
+        with database.transaction():
+            database.add_signature("pdf", "25504446", 0)
+            database.add_signature("png", "89504E47", 0)
+        
+        assert not database.conn.in_transaction
+        assert database.signature_count() == 2
+    
+    def test_transaction_rolls_back_on_error(self, database):
+        """Test that an exception discards every write in the transaction."""
+        with pytest.raises(DatabaseError):
+            with database.transaction():
+                database.add_signature("pdf", "25504446", 0)
+                database.add_signature("pdf", "25504446", 0)
+        
+        assert not database.conn.in_transaction
+        assert database.signature_count() == 0
+    
+    def test_failed_commit_rolls_back(self, database):
+        """Test that a failing COMMIT does not leave the transaction open."""
+        conn = database.conn
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.execute("CREATE TABLE parent (id INTEGER PRIMARY KEY)")
+        conn.execute(
+            "CREATE TABLE child (parent_id INTEGER REFERENCES parent(id) "
+            "DEFERRABLE INITIALLY DEFERRED)"
+        )
+        
+        # The deferred foreign key is only checked, and fails, at COMMIT
+        with pytest.raises(sqlite3.IntegrityError):
+            with database.transaction():
+                database.add_signature("pdf", "25504446", 0)
+                conn.execute("INSERT INTO child VALUES (1)")
+        
+        assert not conn.in_transaction
+        
+        with database.transaction():
+            database.add_signature("png", "89504E47", 0)
+        
+        reader = sqlite3.connect(str(database.db_path))
+        try:
+            rows = reader.execute("SELECT extension FROM signatures").fetchall()
+        finally:
+            reader.close()
+        assert rows == [("png",)]
+    
+    def test_nested_transaction_joins_outer(self, database):
+        """Test that an inner transaction does not commit early."""
+        with database.transaction():
+            with database.transaction():
+                database.add_signature("pdf", "25504446", 0)
+            
+            assert database.conn.in_transaction
+        
+        assert database.signature_count() == 1
+
+
 class TestContextManager:
     """Test database context manager usage."""
     
@@ -387,6 +728,10 @@ class TestDatabaseIntegration:
         # First connection: add data
         db1 = Database(db_path=str(temp_db_path))
         db1.add_signature("pdf", "25504446", 0)
+        
+        # Merge the WAL into the main file so the reopen has nothing to recover
+        busy = db1.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()[0]
+        assert busy == 0
         db1.close()
         
         # Second connection: verify data exists
@@ -413,38 +758,16 @@ class TestDatabaseErrorHandling:
         assert "Failed to" in str(exc_info.value)
         assert "database" in str(exc_info.value).lower()
     
-    def test_get_signatures_database_error(self, database):
-        """Test get_signatures handles database errors."""
-        # Close connection to simulate database error
-        database.conn.close()
-        database.conn = None
-        
-        with pytest.raises(AttributeError):
-            database.get_signatures("pdf")
-    
-    def test_add_signature_database_error(self, database):
-        """Test add_signature handles database errors."""
-        # Close connection to simulate database error
-        database.conn.close()
-        database.conn = None
-        
-        with pytest.raises(AttributeError):
-            database.add_signature("test", "AABBCCDD", 0)
-    
-    def test_get_all_extensions_database_error(self, database):
-        """Test get_all_extensions handles database errors."""
-        # Close connection to simulate database error
-        database.conn.close()
-        database.conn = None
-        
-        with pytest.raises(AttributeError):
-            database.get_all_extensions()
-    
-    def test_signature_count_database_error(self, database):
-        """Test signature_count handles database errors."""
-        # Close connection to simulate database error
-        database.conn.close()
-        database.conn = None
-        
+    @pytest.mark.parametrize(
+        "method, args",
+        [
+            ("get_signatures", ("pdf",)),
+            ("add_signature", ("test", "AABBCCDD", 0)),
+            ("get_all_extensions", ()),
+            ("signature_count", ()),
+        ],
+    )
+    def test_closed_connection_raises(self, closed_database, method, args):
+        """Test that operations on a closed connection fail loudly."""
         with pytest.raises(AttributeError):
-            database.signature_count()
+            getattr(closed_database, method)(*args)
@@ -0,0 +1,282 @@
+"""Tests for the logging utilities.
+
+Tests cover:
+- NDJSONHandler output format
+- NDJSON environment switch
+- Daily log file rotation
+- Old log cleanup
+- logger_for level handling
+- DEBUG_ENABLED refresh in setup_logging
+"""
+
+import json
+import logging
+import logging.handlers
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+from magicguard.utils import config
+from magicguard.utils import logger as logger_module
+from magicguard.utils.logger import (
+    NDJSONHandler,
+    cleanup_old_logs,
+    logger_for,
+    rotate_log_file_if_needed,
+    setup_logging,
+)
+
+
+def make_record(msg, level=logging.INFO, name="magicguard.test", exc_info=None):
+    """Build a LogRecord without going through a configured logger."""
+    return logging.LogRecord(name, level, __file__, 1, msg, None, exc_info)
+
+
+@pytest.fixture
+def ndjson_file(tmp_path):
+    """Provide the path an NDJSONHandler writes to."""
+    return tmp_path / "log.ndjson"
+
+
+@pytest.fixture
+def ndjson_handler(ndjson_file):
+    """Provide an NDJSONHandler that is closed after the test."""
+    handler = NDJSONHandler(ndjson_file, mode="a", encoding="utf-8")
+    yield handler
+    handler.close()
+
+
+def read_lines(path):
+    """Parse every line of an NDJSON file."""
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+class TestNDJSONHandler:
+    """Test NDJSONHandler output."""
+    
+    def test_emits_one_object_per_line(self, ndjson_handler, ndjson_file):
+        """Test that each record becomes one JSON object with the short keys."""
+        record = make_record('Quoted "message"\nwith newline')
+        
+        ndjson_handler.handle(record)
+        ndjson_handler.handle(make_record("second", level=logging.WARNING))
+        
+        first, second = read_lines(ndjson_file)
+        assert first == {
+            "t": pytest.approx(record.created, abs=1e-3),
+            "l": "INFO",
+            "n": "magicguard.test",
+            "m": 'Quoted "message"\nwith newline',
+        }
+        assert second["l"] == "WARNING"
+        assert second["m"] == "second"
+    
+    def test_escapes_custom_level_name(self, ndjson_handler, ndjson_file):
+        """Test that level names with quotes or backslashes stay valid JSON."""
+        record = make_record("custom level", level=25)
+        record.levelname = 'AUDIT "x" \\ y'
+        
+        ndjson_handler.handle(record)
+        
+        [line] = read_lines(ndjson_file)
+        assert line["l"] == 'AUDIT "x" \\ y'
+    
+    def test_includes_traceback(self, ndjson_handler, ndjson_file):
+        """Test that exception info is written to the 'x' field."""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = make_record("failed", level=logging.ERROR, exc_info=sys.exc_info())
+        
+        ndjson_handler.handle(record)
+        
+        [line] = read_lines(ndjson_file)
+        assert line["m"] == "failed"
+        assert line["x"].startswith("Traceback (most recent call last):")
+        assert "ValueError: boom" in line["x"]
+    
+    def test_omits_traceback_without_exc_info(self, ndjson_handler, ndjson_file):
+        """Test that records without exception info have no 'x' field."""
+        ndjson_handler.handle(make_record("plain"))
+        
+        [line] = read_lines(ndjson_file)
+        assert "x" not in line
+
+
+class TestGetLogNDJSON:
+    """Test the NDJSON environment switch."""
+    
+    def test_default_without_env(self, monkeypatch):
+        """Test that LOG_NDJSON is used when the variable is unset."""
+        monkeypatch.delenv(config.ENV_LOG_NDJSON, raising=False)
+        
+        assert config.get_log_ndjson() is config.LOG_NDJSON
+    
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("1", True),
+            ("true", True),
+            (" YES ", True),
+            ("on", True),
+            ("0", False),
+            ("false", False),
+            ("", False),
+        ],
+    )
+    def test_env_override(self, monkeypatch, value, expected):
+        """Test that the environment variable overrides the default."""
+        monkeypatch.setenv(config.ENV_LOG_NDJSON, value)
+        
+        assert config.get_log_ndjson() is expected
+
+
+@pytest.fixture
+def root_handlers(monkeypatch):
+    """Give the root logger a private handler list, closed after the test."""
+    handlers = []
+    monkeypatch.setattr(logging.getLogger(), "handlers", handlers)
+    yield handlers
+    for handler in file_handlers(handlers):
+        handler.close()
+
+
+def file_handlers(handlers):
+    """Return the file handlers, ignoring pytest's own capture handler."""
+    return [h for h in handlers if isinstance(h, logging.FileHandler)]
+
+
+class TestRotateLogFile:
+    """Test rotate_log_file_if_needed function."""
+    
+    @pytest.mark.parametrize(
+        "handler_class, expected_class",
+        [
+            (logging.FileHandler, logging.FileHandler),
+            (NDJSONHandler, NDJSONHandler),
+            (logging.handlers.TimedRotatingFileHandler, logging.FileHandler),
+        ],
+        ids=["text", "ndjson", "foreign-subclass"],
+    )
+    def test_rotates_stale_handler(
+        self, root_handlers, tmp_path, handler_class, expected_class
+    ):
+        """Test that yesterday's handler is replaced by one for today."""
+        stale = handler_class(str(tmp_path / "2000-01-01.log"), encoding="utf-8")
+        stale.setLevel(logging.WARNING)
+        root_handlers.append(stale)
+        
+        rotate_log_file_if_needed(tmp_path)
+        
+        [handler] = file_handlers(root_handlers)
+        assert type(handler) is expected_class
+        assert handler.level == logging.WARNING
+        assert handler.baseFilename == os.path.abspath(
+            tmp_path / datetime.now().strftime(config.LOG_FILE_FORMAT)
+        )
+    
+    def test_keeps_current_handler(self, root_handlers, tmp_path):
+        """Test that a handler already writing today's file is left alone."""
+        current = logging.FileHandler(
+            tmp_path / datetime.now().strftime(config.LOG_FILE_FORMAT),
+            encoding="utf-8",
+        )
+        root_handlers.append(current)
+        
+        rotate_log_file_if_needed(tmp_path)
+        
+        assert file_handlers(root_handlers) == [current]
+    
+    def test_without_file_handler(self, root_handlers, tmp_path):
+        """Test that nothing happens when no file handler is installed."""
+        stream = logging.StreamHandler()
+        root_handlers.append(stream)
+        
+        rotate_log_file_if_needed(tmp_path)
+        
+        assert stream in root_handlers
+        assert file_handlers(root_handlers) == []
+
+
+class TestCleanupOldLogs:
+    """Test cleanup_old_logs function."""
+    
+    def test_removes_only_old_dated_logs(self, tmp_path):
+        """Test that dated logs past max_days are deleted and others kept."""
+        today = datetime.now()
+        old = tmp_path / (today - timedelta(days=40)).strftime("%Y-%m-%d.log")
+        recent = tmp_path / (today - timedelta(days=5)).strftime("%Y-%m-%d.log")
+        undated = tmp_path / "custom.log"
+        other = tmp_path / "2000-01-01.txt"
+        for path in (old, recent, undated, other):
+            path.write_text("entry\n")
+        
+        deleted = cleanup_old_logs(str(tmp_path), max_days=30)
+        
+        assert deleted == 1
+        assert sorted(tmp_path.iterdir()) == sorted([recent, undated, other])
+    
+    def test_missing_directory(self, tmp_path):
+        """Test that a missing log directory deletes nothing."""
+        assert cleanup_old_logs(tmp_path / "missing") == 0
+
+
+class TestLoggerFor:
+    """Test logger_for function."""
+    
+    def test_sets_level_from_name(self):
+        """Test that a level name is applied to the logger."""
+        logger = logger_for("magicguard.test.logger_for.named", "warning")
+        
+        assert logger.level == logging.WARNING
+        assert not logger.disabled
+        assert not logger.isEnabledFor(logging.INFO)
+    
+    def test_disables_above_critical(self):
+        """Test that levels above CRITICAL disable the logger entirely."""
+        logger = logger_for("magicguard.test.logger_for.silent", logging.CRITICAL + 1)
+        
+        assert logger.disabled
+        
+        logger = logger_for("magicguard.test.logger_for.silent", logging.DEBUG)
+        
+        assert not logger.disabled
+    
+    @pytest.mark.parametrize("level", ["verbose", "", None, 1.5, True])
+    def test_rejects_invalid_level(self, level):
+        """Test that unknown level names and non-int levels raise ValueError."""
+        name = "magicguard.test.logger_for.invalid"
+        
+        with pytest.raises(ValueError):
+            logger_for(name, level)
+        
+        assert logging.getLogger(name).level == logging.NOTSET
+
+
+@pytest.fixture
+def fresh_logging(monkeypatch, root_handlers):
+    """Let setup_logging run again, restoring the root level afterwards."""
+    root = logging.getLogger()
+    original_level = root.level
+    monkeypatch.setattr(logger_module, "_initialized", False)
+    monkeypatch.setattr(logger_module, "DEBUG_ENABLED", logger_module.DEBUG_ENABLED)
+    yield
+    root.setLevel(original_level)
+
+
+class TestDebugEnabled:
+    """Test the DEBUG_ENABLED flag maintained by setup_logging."""
+    
+    @pytest.mark.parametrize(
+        "level, expected",
+        [("DEBUG", True), ("INFO", False), ("WARNING", False)],
+    )
+    def test_refreshed_by_setup_logging(self, fresh_logging, tmp_path, level, expected):
+        """Test that the flag follows the configured root level."""
+        logger_module.DEBUG_ENABLED = not expected
+        
+        setup_logging(level=level, log_dir=tmp_path)
+        
+        assert logger_module.DEBUG_ENABLED is expected
@@ -7,12 +7,14 @@ Tests cover:
 - ReaderFactory: reader selection based on file type
 """
 
-from pathlib import Path
-from unittest.mock import MagicMock
+import io
+import os
+import sys
 import zipfile
 
 import pytest
 
+from magicguard.core import readers
 from magicguard.core.readers import (
     SimpleReader,
     ZipBasedReader,
@@ -21,43 +23,206 @@ from magicguard.core.readers import (
 )
 from magicguard.core.exceptions import FileReadError
 
+# Sample payloads shared by fixtures and assertions
+PDF_MAGIC = b"%PDF"
+PDF_SAMPLE = b"%PDF-1.4\nSome content"
+PNG_SAMPLE = b"\x89PNG\r\n\x1a\n"
+TAR_SAMPLE = bytes(257) + b"ustar\x00"  # TAR signature is at offset 257
+ZIP_LOCAL_SIG = b"PK\x03\x04"
+CORRUPTED_ZIP = ZIP_LOCAL_SIG + bytes(100)
+NOT_ZIP = b"Not a ZIP file"
+
+# Fixture archives only need the right members, never compressed payloads
+ZIP_COMPRESSION = zipfile.ZIP_STORED
+
+SIMPLE_FILE_TYPES = (
+    'pdf', 'png', 'jpg', 'jpeg', 'gif', 'bmp', 'ico', 'webp',
+    'mp3', 'mp4', 'avi', 'mkv', 'wav', 'flac',
+    'exe', 'dll', 'elf', 'tar', 'gz', 'rar', '7z',
+    'xml', 'html', 'json', 'sqlite', 'db',
+)
+
+# chmod(0o000) does not stop reads on Windows or for root
+CHMOD_INEFFECTIVE = sys.platform.startswith("win") or (
+    hasattr(os, "geteuid") and os.geteuid() == 0
+)
+
+
+class FakeLogger:
+    """Plain logger stand-in that only remembers which levels were used."""
+    
+    __slots__ = (
+        "debug_called", "info_called", "warning_called", "error_called",
+    )
+    
+    def __init__(self):
+        self.debug_called = False
+        self.info_called = False
+        self.warning_called = False
+        self.error_called = False
+    
+    def debug(self, *args, **kwargs):
+        self.debug_called = True
+    
+    def info(self, *args, **kwargs):
+        self.info_called = True
+    
+    def warning(self, *args, **kwargs):
+        self.warning_called = True
+    
+    def error(self, *args, **kwargs):
+        self.error_called = True
+
+
+def _write_file(path, data):
+    """Write a tiny file with raw os calls, skipping the buffered I/O layers."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    return os.fspath(path)
+
+
+def _build_zip(members):
+    """Return a stored ZIP archive of the given name -> text members as bytes."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', ZIP_COMPRESSION) as zf:
+        for name, content in members.items():
+            zf.writestr(name, content)
+    return buffer.getvalue()
+
+
+def _write_zip(path, members):
+    """Write a stored ZIP archive containing the given name -> text members."""
+    return _write_file(path, _build_zip(members))
+
+
+# Archive bytes built once at import and copied into per-test files
+VALID_ZIP = _build_zip({'file1.txt': 'Content 1', 'file2.txt': 'Content 2'})
+EMPTY_ZIP = _build_zip({})
+
+
+def _raise_permission(*args, **kwargs):
+    """Stand-in for open() on a file the current user may not read."""
+    raise PermissionError(13, "Permission denied")
+
+
+@pytest.fixture(scope="session")
+def signature_dir(tmp_path_factory):
+    """Provide a directory for read-only sample files shared by all tests."""
+    return tmp_path_factory.mktemp("signatures")
+
+
+@pytest.fixture(scope="session")
+def pdf_signature_file(signature_dir):
+    """Provide a small PDF sample file."""
+    return _write_file(signature_dir / "test.pdf", PDF_SAMPLE)
+
+
+@pytest.fixture(scope="session")
+def png_signature_file(signature_dir):
+    """Provide a PNG sample file holding just the signature."""
+    return _write_file(signature_dir / "test.png", PNG_SAMPLE)
+
+
+@pytest.fixture(scope="session")
+def tar_signature_file(signature_dir):
+    """Provide a TAR sample file with its signature at offset 257."""
+    return _write_file(signature_dir / "test.tar", TAR_SAMPLE)
+
+
+@pytest.fixture(
+    scope="module",
+    params=[
+        ("docx", "word/document.xml"),
+        ("xlsx", "xl/workbook.xml"),
+        ("pptx", "ppt/presentation.xml"),
+    ],
+    ids=["docx", "xlsx", "pptx"],
+)
+def valid_office(request, tmp_path_factory):
+    """Provide a minimal valid Office document as (path, extension)."""
+    extension, main_part = request.param
+    directory = tmp_path_factory.mktemp("office")
+    path = _write_zip(directory / f"test.{extension}", {
+        '[Content_Types].xml': '<?xml version="1.0"?>',
+        main_part: '<?xml version="1.0"?>',
+    })
+    return path, extension
+
+
+@pytest.fixture(scope="module")
+def malformed_office(tmp_path_factory):
+    """Provide broken Office documents keyed by what is wrong with them."""
+    directory = tmp_path_factory.mktemp("malformed")
+    xml = '<?xml version="1.0"?>'
+    
+    corpus = {
+        "missing_content_types": _write_zip(
+            directory / "missing_content_types.docx", {'word/document.xml': xml}
+        ),
+        "missing_document_xml": _write_zip(
+            directory / "missing_document_xml.docx", {'[Content_Types].xml': xml}
+        ),
+        "missing_workbook": _write_zip(
+            directory / "missing_workbook.xlsx", {'[Content_Types].xml': xml}
+        ),
+        "not_zip": _write_file(directory / "fake.docx", NOT_ZIP),
+        "corrupted": _write_file(directory / "corrupted.docx", CORRUPTED_ZIP),
+    }
+    return corpus
+
+
+@pytest.fixture(scope="session")
+def simple_reader():
+    """Provide one SimpleReader shared by all tests."""
+    return SimpleReader()
+
+
+@pytest.fixture(scope="session")
+def zip_based_reader():
+    """Provide one ZipBasedReader shared by all tests."""
+    return ZipBasedReader()
+
+
+@pytest.fixture(scope="session")
+def plain_zip_reader():
+    """Provide one PlainZipReader shared by all tests."""
+    return PlainZipReader()
+
+
+@pytest.fixture(scope="session")
+def reader_factory():
+    """Provide one ReaderFactory shared by all tests."""
+    return ReaderFactory()
+
 
 class TestSimpleReader:
     """Test SimpleReader for basic file types."""
     
     @pytest.fixture
-    def reader(self):
+    def reader(self, simple_reader):
         """Provide SimpleReader instance."""
-        return SimpleReader()
+        return simple_reader
     
-    def test_read_signature_from_file(self, reader, tmp_path):
+    def test_read_signature_from_file(self, reader, pdf_signature_file):
         """Test reading signature bytes from file."""
-        test_file = tmp_path / "test.pdf"
-        test_file.write_bytes(b"%PDF-1.4\nSome content")
-        
-        signature = reader.read_signature(str(test_file), length=4, offset=0)
+        signature = reader.read_signature(pdf_signature_file, length=4, offset=0)
         
-        assert signature == b"%PDF"
+        assert signature == PDF_MAGIC
     
-    def test_read_signature_with_offset(self, reader, tmp_path):
+    def test_read_signature_with_offset(self, reader, tar_signature_file):
         """Test reading signature at non-zero offset."""
-        test_file = tmp_path / "test.tar"
-        # TAR signature is at offset 257
-        data = b"\x00" * 257 + b"ustar\x00"
-        test_file.write_bytes(data)
-        
-        signature = reader.read_signature(str(test_file), length=5, offset=257)
+        signature = reader.read_signature(tar_signature_file, length=5, offset=257)
         
         assert signature == b"ustar"
     
-    def test_read_signature_full_length(self, reader, tmp_path):
+    def test_read_signature_full_length(self, reader, png_signature_file):
         """Test reading complete signature."""
-        test_file = tmp_path / "test.png"
-        test_file.write_bytes(b"\x89PNG\r\n\x1a\n")
-        
-        signature = reader.read_signature(str(test_file), length=8, offset=0)
+        signature = reader.read_signature(png_signature_file, length=8, offset=0)
         
-        assert signature == b"\x89PNG\r\n\x1a\n"
+        assert signature == PNG_SAMPLE
     
     def test_read_signature_file_not_found(self, reader):
         """Test error when file doesn't exist."""
@@ -68,336 +233,220 @@ class TestSimpleReader:
     
     def test_read_signature_empty_file(self, reader, tmp_path):
         """Test reading from empty file."""
-        test_file = tmp_path / "empty.txt"
-        test_file.write_bytes(b"")
+        test_file = _write_file(tmp_path / "empty.txt", b"")
         
-        signature = reader.read_signature(str(test_file), length=4, offset=0)
+        signature = reader.read_signature(test_file, length=4, offset=0)
         
         assert signature == b""
     
-    def test_read_signature_permission_error(self, reader, tmp_path):
+    def test_read_signature_permission_error(
+        self, reader, pdf_signature_file, monkeypatch
+    ):
         """Test IOError when file cannot be read due to permissions."""
-        test_file = tmp_path / "noperm.txt"
-        test_file.write_bytes(b"data")
-        test_file.chmod(0o000)  # Remove all permissions
+        monkeypatch.setattr(readers, "open", _raise_permission, raising=False)
+        
+        with pytest.raises(FileReadError) as exc_info:
+            reader.read_signature(pdf_signature_file, length=4, offset=0)
+        
+        assert "Failed to read file" in str(exc_info.value)
+    
+    @pytest.mark.skipif(CHMOD_INEFFECTIVE, reason="chmod(0o000) not effective")
+    def test_read_signature_unreadable_file(self, reader, tmp_path):
+        """Test a real permission denial from the filesystem."""
+        test_file = _write_file(tmp_path / "noperm.txt", b"data")
+        os.chmod(test_file, 0o000)
         
         try:
-            with pytest.raises(FileReadError) as exc_info:
-                reader.read_signature(str(test_file), length=4, offset=0)
-            
-            assert "Failed to read file" in str(exc_info.value)
+            with pytest.raises(FileReadError):
+                reader.read_signature(test_file, length=4, offset=0)
         finally:
-            test_file.chmod(0o644)  # Restore permissions for cleanup
-    
-    def test_supports_pdf(self, reader):
-        """Test that SimpleReader supports PDF files."""
-        assert reader.supports_file_type("pdf") is True
-    
-    def test_supports_image_formats(self, reader):
-        """Test support for various image formats."""
-        for ext in ["png", "jpg", "jpeg", "gif", "bmp", "ico", "webp"]:
-            assert reader.supports_file_type(ext) is True
-    
-    def test_supports_media_formats(self, reader):
-        """Test support for audio/video formats."""
-        for ext in ["mp3", "mp4", "avi", "mkv", "wav", "flac"]:
-            assert reader.supports_file_type(ext) is True
-    
-    def test_supports_archive_formats(self, reader):
-        """Test support for archive formats."""
-        for ext in ["rar", "7z", "tar", "gz"]:
-            assert reader.supports_file_type(ext) is True
-    
-    def test_does_not_support_office_formats(self, reader):
-        """Test that Office formats are not supported by SimpleReader."""
-        for ext in ["docx", "xlsx", "pptx"]:
-            assert reader.supports_file_type(ext) is False
-    
-    def test_does_not_support_zip(self, reader):
-        """Test that ZIP is not supported by SimpleReader."""
-        assert reader.supports_file_type("zip") is False
-    
-    def test_supports_case_insensitive(self, reader):
-        """Test that extension matching is case insensitive."""
-        assert reader.supports_file_type("PDF") is True
-        assert reader.supports_file_type("Png") is True
-        assert reader.supports_file_type("MP3") is True
-    
-    def test_validate_structure_returns_true(self, reader, tmp_path):
+            os.chmod(test_file, 0o644)  # Restore permissions for cleanup
+    
+    @pytest.mark.parametrize(
+        "ext, expected",
+        [
+            ("pdf", True),
+            ("png", True), ("jpg", True), ("jpeg", True), ("gif", True),
+            ("bmp", True), ("ico", True), ("webp", True),
+            ("mp3", True), ("mp4", True), ("avi", True), ("mkv", True),
+            ("wav", True), ("flac", True),
+            ("rar", True), ("7z", True), ("tar", True), ("gz", True),
+            ("PDF", True), ("Png", True), ("MP3", True),
+            ("docx", False), ("xlsx", False), ("pptx", False),
+            ("zip", False),
+        ],
+    )
+    def test_supports(self, reader, ext, expected):
+        """Test which extensions SimpleReader handles (case insensitive)."""
+        assert reader.supports_file_type(ext) is expected
+    
+    def test_validate_structure_returns_true(self, reader, pdf_signature_file):
         """Test that structure validation always returns True for simple files."""
-        test_file = tmp_path / "test.pdf"
-        test_file.write_bytes(b"%PDF-1.4")
-        
-        result = reader.validate_structure(str(test_file), "pdf")
+        result = reader.validate_structure(pdf_signature_file, "pdf")
         
         assert result is True
     
     def test_custom_logger(self, tmp_path):
         """Test SimpleReader with custom logger."""
-        mock_logger = MagicMock()
+        mock_logger = FakeLogger()
         reader = SimpleReader(logger=mock_logger)
         
-        test_file = tmp_path / "test.pdf"
-        test_file.write_bytes(b"%PDF")
-        reader.read_signature(str(test_file), 4, 0)
+        test_file = _write_file(tmp_path / "test.pdf", PDF_MAGIC)
+        reader.read_signature(test_file, 4, 0)
         
         # Logger should have been called
-        assert mock_logger.debug.called
+        assert mock_logger.debug_called
 
 
 class TestZipBasedReader:
     """Test ZipBasedReader for Office documents."""
     
     @pytest.fixture
-    def reader(self):
+    def reader(self, zip_based_reader):
         """Provide ZipBasedReader instance."""
-        return ZipBasedReader()
-    
-    @pytest.fixture
-    def valid_docx(self, tmp_path):
-        """Create a valid DOCX file structure."""
-        docx_file = tmp_path / "test.docx"
-        with zipfile.ZipFile(docx_file, 'w') as zf:
-            zf.writestr('[Content_Types].xml', '<?xml version="1.0"?>')
-            zf.writestr('word/document.xml', '<?xml version="1.0"?>')
-        return docx_file
+        return zip_based_reader
     
-    @pytest.fixture
-    def valid_xlsx(self, tmp_path):
-        """Create a valid XLSX file structure."""
-        xlsx_file = tmp_path / "test.xlsx"
-        with zipfile.ZipFile(xlsx_file, 'w') as zf:
-            zf.writestr('[Content_Types].xml', '<?xml version="1.0"?>')
-            zf.writestr('xl/workbook.xml', '<?xml version="1.0"?>')
-        return xlsx_file
-    
-    @pytest.fixture
-    def valid_pptx(self, tmp_path):
-        """Create a valid PPTX file structure."""
-        pptx_file = tmp_path / "test.pptx"
-        with zipfile.ZipFile(pptx_file, 'w') as zf:
-            zf.writestr('[Content_Types].xml', '<?xml version="1.0"?>')
-            zf.writestr('ppt/presentation.xml', '<?xml version="1.0"?>')
-        return pptx_file
-    
-    def test_read_signature(self, reader, valid_docx):
+    def test_read_signature(self, reader, valid_office):
         """Test reading ZIP signature from Office document."""
-        signature = reader.read_signature(str(valid_docx), length=4, offset=0)
+        path, _ = valid_office
+        signature = reader.read_signature(path, length=4, offset=0)
         
         # ZIP files start with PK\x03\x04
-        assert signature == b'PK\x03\x04'
-    
-    def test_supports_docx(self, reader):
-        """Test that ZipBasedReader supports DOCX."""
-        assert reader.supports_file_type("docx") is True
-    
-    def test_supports_xlsx(self, reader):
-        """Test that ZipBasedReader supports XLSX."""
-        assert reader.supports_file_type("xlsx") is True
-    
-    def test_supports_pptx(self, reader):
-        """Test that ZipBasedReader supports PPTX."""
-        assert reader.supports_file_type("pptx") is True
-    
-    def test_does_not_support_pdf(self, reader):
-        """Test that PDF is not supported by ZipBasedReader."""
-        assert reader.supports_file_type("pdf") is False
-    
-    def test_does_not_support_zip(self, reader):
-        """Test that plain ZIP is not supported by ZipBasedReader."""
-        assert reader.supports_file_type("zip") is False
-    
-    def test_validate_structure_docx_valid(self, reader, valid_docx):
-        """Test validation of valid DOCX structure."""
-        result = reader.validate_structure(str(valid_docx), "docx")
-        
-        assert result is True
-    
-    def test_validate_structure_xlsx_valid(self, reader, valid_xlsx):
-        """Test validation of valid XLSX structure."""
-        result = reader.validate_structure(str(valid_xlsx), "xlsx")
+        assert signature == ZIP_LOCAL_SIG
+    
+    @pytest.mark.parametrize(
+        "ext, expected",
+        [
+            ("docx", True), ("xlsx", True), ("pptx", True),
+            ("pdf", False), ("zip", False),
+        ],
+    )
+    def test_supports(self, reader, ext, expected):
+        """Test that ZipBasedReader handles Office formats only."""
+        assert reader.supports_file_type(ext) is expected
+    
+    def test_validate_structure_valid(self, reader, valid_office):
+        """Test validation of valid DOCX, XLSX and PPTX structures."""
+        path, extension = valid_office
+        result = reader.validate_structure(path, extension)
         
         assert result is True
     
-    def test_validate_structure_pptx_valid(self, reader, valid_pptx):
-        """Test validation of valid PPTX structure."""
-        result = reader.validate_structure(str(valid_pptx), "pptx")
-        
-        assert result is True
-    
-    def test_validate_structure_docx_missing_content_types(self, reader, tmp_path):
-        """Test validation fails when [Content_Types].xml is missing."""
-        docx_file = tmp_path / "invalid.docx"
-        with zipfile.ZipFile(docx_file, 'w') as zf:
-            zf.writestr('word/document.xml', '<?xml version="1.0"?>')
-        
-        result = reader.validate_structure(str(docx_file), "docx")
-        
-        assert result is False
-    
-    def test_validate_structure_docx_missing_document_xml(self, reader, tmp_path):
-        """Test validation fails when word/document.xml is missing."""
-        docx_file = tmp_path / "invalid.docx"
-        with zipfile.ZipFile(docx_file, 'w') as zf:
-            zf.writestr('[Content_Types].xml', '<?xml version="1.0"?>')
-        
-        result = reader.validate_structure(str(docx_file), "docx")
-        
-        assert result is False
-    
-    def test_validate_structure_xlsx_missing_workbook(self, reader, tmp_path):
-        """Test validation fails when xl/workbook.xml is missing."""
-        xlsx_file = tmp_path / "invalid.xlsx"
-        with zipfile.ZipFile(xlsx_file, 'w') as zf:
-            zf.writestr('[Content_Types].xml', '<?xml version="1.0"?>')
-        
-        result = reader.validate_structure(str(xlsx_file), "xlsx")
-        
-        assert result is False
-    
-    def test_validate_structure_not_zip(self, reader, tmp_path):
-        """Test validation fails for non-ZIP file."""
-        fake_docx = tmp_path / "fake.docx"
-        fake_docx.write_bytes(b"Not a ZIP file")
-        
-        result = reader.validate_structure(str(fake_docx), "docx")
-        
-        assert result is False
-    
-    def test_validate_structure_corrupted_zip(self, reader, tmp_path):
-        """Test that corrupted ZIP returns False."""
-        corrupted = tmp_path / "corrupted.docx"
-        corrupted.write_bytes(b"PK\x03\x04" + b"\x00" * 100)
-        
-        result = reader.validate_structure(str(corrupted), "docx")
+    @pytest.mark.parametrize(
+        "defect, extension",
+        [
+            ("missing_content_types", "docx"),
+            ("missing_document_xml", "docx"),
+            ("missing_workbook", "xlsx"),
+            ("not_zip", "docx"),
+            ("corrupted", "docx"),
+        ],
+    )
+    def test_validate_structure_invalid(
+        self, reader, malformed_office, defect, extension
+    ):
+        """Test validation fails for missing members, non-ZIP and corrupted files."""
+        result = reader.validate_structure(malformed_office[defect], extension)
         
         assert result is False
     
-    def test_validate_structure_unknown_extension(self, reader, valid_docx):
+    def test_validate_structure_unknown_extension(self, reader, valid_office):
         """Test validation returns False for unknown extension."""
-        result = reader.validate_structure(str(valid_docx), "unknown")
+        path, _ = valid_office
+        result = reader.validate_structure(path, "unknown")
         
         assert result is False
     
-    def test_validate_structure_io_error(self, reader, tmp_path):
-        """Test that permission errors during validation return False."""
-        test_file = tmp_path / "noperm.docx"
-        with zipfile.ZipFile(test_file, 'w') as zf:
-            zf.writestr('[Content_Types].xml', '<?xml version="1.0"?>')
-        test_file.chmod(0o000)  # Remove all permissions
+    def test_validate_structure_io_error(self, reader, valid_office, monkeypatch):
+        """Test that access errors during validation raise FileReadError."""
+        path, extension = valid_office
+        monkeypatch.setattr(readers.zipfile, "is_zipfile", _raise_permission)
         
-        try:
-            # Permission denied treated as invalid ZIP, returns False
-            result = reader.validate_structure(str(test_file), "docx")
-            assert result is False
-        finally:
-            test_file.chmod(0o644)  # Restore permissions
+        with pytest.raises(FileReadError) as exc_info:
+            reader.validate_structure(path, extension)
+        
+        assert "Failed to access file" in str(exc_info.value)
 
 
 class TestPlainZipReader:
     """Test PlainZipReader for plain ZIP archives."""
     
     @pytest.fixture
-    def reader(self):
+    def reader(self, plain_zip_reader):
         """Provide PlainZipReader instance."""
-        return PlainZipReader()
+        return plain_zip_reader
     
     @pytest.fixture
     def valid_zip(self, tmp_path):
         """Create a valid ZIP file."""
-        zip_file = tmp_path / "test.zip"
-        with zipfile.ZipFile(zip_file, 'w') as zf:
-            zf.writestr('file1.txt', 'Content 1')
-            zf.writestr('file2.txt', 'Content 2')
-        return zip_file
+        return _write_file(tmp_path / "test.zip", VALID_ZIP)
     
     def test_read_signature(self, reader, valid_zip):
         """Test reading ZIP signature."""
-        signature = reader.read_signature(str(valid_zip), length=4, offset=0)
-        
-        assert signature == b'PK\x03\x04'
-    
-    def test_supports_zip(self, reader):
-        """Test that PlainZipReader supports ZIP."""
-        assert reader.supports_file_type("zip") is True
-    
-    def test_supports_case_insensitive(self, reader):
-        """Test case-insensitive extension matching."""
-        assert reader.supports_file_type("ZIP") is True
-        assert reader.supports_file_type("Zip") is True
-    
-    def test_does_not_support_office_formats(self, reader):
-        """Test that Office formats are not supported."""
-        for ext in ["docx", "xlsx", "pptx"]:
-            assert reader.supports_file_type(ext) is False
-    
-    def test_does_not_support_other_formats(self, reader):
-        """Test that other formats are not supported."""
-        for ext in ["pdf", "png", "mp3"]:
-            assert reader.supports_file_type(ext) is False
+        signature = reader.read_signature(valid_zip, length=4, offset=0)
+        
+        assert signature == ZIP_LOCAL_SIG
+    
+    @pytest.mark.parametrize(
+        "ext, expected",
+        [
+            ("zip", True), ("ZIP", True), ("Zip", True),
+            ("docx", False), ("xlsx", False), ("pptx", False),
+            ("pdf", False), ("png", False), ("mp3", False),
+        ],
+    )
+    def test_supports(self, reader, ext, expected):
+        """Test that PlainZipReader handles plain ZIP only (case insensitive)."""
+        assert reader.supports_file_type(ext) is expected
     
     def test_validate_structure_valid_zip(self, reader, valid_zip):
         """Test validation of valid ZIP file."""
-        result = reader.validate_structure(str(valid_zip), "zip")
+        result = reader.validate_structure(valid_zip, "zip")
         
         assert result is True
     
     def test_validate_structure_invalid_zip(self, reader, tmp_path):
         """Test validation fails for non-ZIP file."""
-        fake_zip = tmp_path / "fake.zip"
-        fake_zip.write_bytes(b"Not a ZIP file")
+        fake_zip = _write_file(tmp_path / "fake.zip", NOT_ZIP)
         
-        result = reader.validate_structure(str(fake_zip), "zip")
+        result = reader.validate_structure(fake_zip, "zip")
         
         assert result is False
     
     def test_validate_structure_empty_zip(self, reader, tmp_path):
         """Test validation of empty ZIP file."""
-        empty_zip = tmp_path / "empty.zip"
-        with zipfile.ZipFile(empty_zip, 'w'):
-            pass  # Create empty ZIP
+        empty_zip = _write_file(tmp_path / "empty.zip", EMPTY_ZIP)
         
-        result = reader.validate_structure(str(empty_zip), "zip")
+        result = reader.validate_structure(empty_zip, "zip")
         
         assert result is True
     
-    def test_read_signature_permission_error(self, reader, tmp_path):
+    def test_read_signature_permission_error(self, reader, valid_zip, monkeypatch):
         """Test IOError when file cannot be read."""
-        test_file = tmp_path / "noperm.zip"
-        with zipfile.ZipFile(test_file, 'w') as zf:
-            zf.writestr('test.txt', 'content')
-        test_file.chmod(0o000)
+        monkeypatch.setattr(readers, "open", _raise_permission, raising=False)
         
-        try:
-            with pytest.raises(FileReadError) as exc_info:
-                reader.read_signature(str(test_file), length=4, offset=0)
-            
-            assert "Failed to read file" in str(exc_info.value)
-        finally:
-            test_file.chmod(0o644)
+        with pytest.raises(FileReadError) as exc_info:
+            reader.read_signature(valid_zip, length=4, offset=0)
+        
+        assert "Failed to read file" in str(exc_info.value)
     
-    def test_validate_structure_io_error(self, reader, tmp_path):
-        """Test that permission errors during validation return False."""
-        test_file = tmp_path / "noperm.zip"
-        with zipfile.ZipFile(test_file, 'w') as zf:
-            zf.writestr('test.txt', 'content')
-        test_file.chmod(0o000)
+    def test_validate_structure_io_error(self, reader, valid_zip, monkeypatch):
+        """Test that access errors during validation raise FileReadError."""
+        monkeypatch.setattr(readers.zipfile, "is_zipfile", _raise_permission)
         
-        try:
-            # Permission denied treated as invalid ZIP, returns False
-            result = reader.validate_structure(str(test_file), "zip")
-            assert result is False
-        finally:
-            test_file.chmod(0o644)
+        with pytest.raises(FileReadError) as exc_info:
+            reader.validate_structure(valid_zip, "zip")
+        
+        assert "Failed to access file" in str(exc_info.value)
 
 
 class TestReaderFactory:
     """Test ReaderFactory for selecting appropriate readers."""
     
     @pytest.fixture
-    def factory(self):
+    def factory(self, reader_factory):
         """Provide ReaderFactory instance."""
-        return ReaderFactory()
+        return reader_factory
     
     def test_get_reader_for_pdf(self, factory):
         """Test factory returns SimpleReader for PDF."""
@@ -435,15 +484,19 @@ class TestReaderFactory:
         
         assert isinstance(reader, PlainZipReader)
     
-    def test_get_reader_case_insensitive(self, factory):
-        """Test factory works with uppercase extensions."""
-        reader_pdf = factory.get_reader("PDF")
-        reader_docx = factory.get_reader("DOCX")
-        reader_zip = factory.get_reader("ZIP")
-        
-        assert isinstance(reader_pdf, SimpleReader)
-        assert isinstance(reader_docx, ZipBasedReader)
-        assert isinstance(reader_zip, PlainZipReader)
+    @pytest.mark.parametrize(
+        "ext, expected_cls",
+        [
+            ("PDF", SimpleReader),
+            ("DOCX", ZipBasedReader),
+            ("ZIP", PlainZipReader),
+            ("Pdf", SimpleReader),
+            ("DoCx", ZipBasedReader),
+        ],
+    )
+    def test_get_reader_case_insensitive(self, factory, ext, expected_cls):
+        """Test factory works with upper and mixed case extensions."""
+        assert isinstance(factory.get_reader(ext), expected_cls)
     
     def test_get_reader_for_unknown_extension(self, factory):
         """Test factory returns SimpleReader as fallback."""
@@ -460,12 +513,12 @@ class TestReaderFactory:
     
     def test_factory_with_custom_logger(self):
         """Test factory with custom logger."""
-        mock_logger = MagicMock()
+        mock_logger = FakeLogger()
         factory = ReaderFactory(logger=mock_logger)
         
         reader = factory.get_reader("pdf")
         
-        assert mock_logger.debug.called
+        assert mock_logger.debug_called
         assert isinstance(reader, SimpleReader)
     
     def test_reader_priority_zip_based_before_plain(self, factory):
@@ -473,79 +526,85 @@ class TestReaderFactory:
         # DOCX should match ZipBasedReader even though it's a ZIP
         reader = factory.get_reader("docx")
         
-        assert isinstance(reader, ZipBasedReader)
-        assert not isinstance(reader, PlainZipReader)
+        assert type(reader) is ZipBasedReader
     
-    def test_all_simple_file_types(self, factory):
-        """Test factory returns SimpleReader for all simple file types."""
-        simple_types = [
-            'pdf', 'png', 'jpg', 'jpeg', 'gif', 'bmp', 'ico', 'webp',
-            'mp3', 'mp4', 'avi', 'mkv', 'wav', 'flac',
-            'exe', 'dll', 'elf', 'tar', 'gz', 'rar', '7z',
-            'xml', 'html', 'json', 'sqlite', 'db'
-        ]
-        
-        for ext in simple_types:
-            reader = factory.get_reader(ext)
-            assert isinstance(reader, SimpleReader), f"Failed for {ext}"
+    @pytest.mark.parametrize("ext", SIMPLE_FILE_TYPES)
+    def test_simple_file_type(self, factory, ext):
+        """Test factory returns SimpleReader for every simple file type."""
+        assert isinstance(factory.get_reader(ext), SimpleReader)
+
+
+@pytest.fixture(scope="module")
+def corpus_dir(tmp_path_factory):
+    """Provide a directory for the read-only integration corpus."""
+    return tmp_path_factory.mktemp("corpus")
+
+
+@pytest.fixture(scope="module")
+def corpus_pdf(corpus_dir):
+    """Provide a PDF with a binary comment line after the header."""
+    pdf_file = corpus_dir / "test.pdf"
+    return _write_file(pdf_file, b"%PDF-1.4\n%\xE2\xE3\xCF\xD3\n")
+
+
+@pytest.fixture(scope="module")
+def corpus_docx(corpus_dir):
+    """Provide a DOCX with its relationships part."""
+    return _write_zip(corpus_dir / "test.docx", {
+        '[Content_Types].xml': '<?xml version="1.0"?>',
+        'word/document.xml': '<document/>',
+        'word/_rels/document.xml.rels': '<Relationships/>',
+    })
+
+
+@pytest.fixture(scope="module")
+def corpus_zip(corpus_dir):
+    """Provide a plain ZIP archive."""
+    return _write_zip(corpus_dir / "test.zip", {'file.txt': 'content'})
+
+
+@pytest.fixture
+def integration_reader(request, reader_factory):
+    """Provide the factory's reader for the extension given by indirect parametrize."""
+    return reader_factory.get_reader(request.param)
 
 
 class TestReadersIntegration:
     """Integration tests for readers working together."""
     
-    def test_read_and_validate_real_pdf(self, tmp_path):
+    @pytest.mark.parametrize("integration_reader", ["pdf"], indirect=True)
+    def test_read_and_validate_real_pdf(self, integration_reader, corpus_pdf):
         """Test reading and validating a real PDF structure."""
-        factory = ReaderFactory()
-        reader = factory.get_reader("pdf")
-        
-        pdf_file = tmp_path / "test.pdf"
-        pdf_file.write_bytes(b"%PDF-1.4\n%\xE2\xE3\xCF\xD3\n")
+        reader = integration_reader
         
-        signature = reader.read_signature(str(pdf_file), 4, 0)
-        is_valid = reader.validate_structure(str(pdf_file), "pdf")
+        signature = reader.read_signature(corpus_pdf, 4, 0)
+        is_valid = reader.validate_structure(corpus_pdf, "pdf")
         
-        assert signature == b"%PDF"
+        assert signature == PDF_MAGIC
         assert is_valid is True
     
-    def test_read_and_validate_real_docx(self, tmp_path):
+    @pytest.mark.parametrize("integration_reader", ["docx"], indirect=True)
+    def test_read_and_validate_real_docx(self, integration_reader, corpus_docx):
         """Test reading and validating a real DOCX structure."""
-        factory = ReaderFactory()
-        reader = factory.get_reader("docx")
-        
-        docx_file = tmp_path / "test.docx"
-        with zipfile.ZipFile(docx_file, 'w') as zf:
-            zf.writestr('[Content_Types].xml', '<?xml version="1.0"?>')
-            zf.writestr('word/document.xml', '<document/>')
-            zf.writestr('word/_rels/document.xml.rels', '<Relationships/>')
+        reader = integration_reader
         
-        signature = reader.read_signature(str(docx_file), 4, 0)
-        is_valid = reader.validate_structure(str(docx_file), "docx")
+        signature = reader.read_signature(corpus_docx, 4, 0)
+        is_valid = reader.validate_structure(corpus_docx, "docx")
         
-        assert signature == b'PK\x03\x04'
+        assert signature == ZIP_LOCAL_SIG
         assert is_valid is True
     
-    def test_factory_selects_correct_reader_for_validation(self, tmp_path):
+    def test_factory_selects_correct_reader_for_validation(
+        self, reader_factory, corpus_docx, corpus_zip
+    ):
         """Test that factory selection leads to correct validation."""
-        factory = ReaderFactory()
-        
-        # Create DOCX
-        docx_file = tmp_path / "test.docx"
-        with zipfile.ZipFile(docx_file, 'w') as zf:
-            zf.writestr('[Content_Types].xml', '<?xml version="1.0"?>')
-            zf.writestr('word/document.xml', '<document/>')
-        
-        # Create plain ZIP
-        zip_file = tmp_path / "test.zip"
-        with zipfile.ZipFile(zip_file, 'w') as zf:
-            zf.writestr('file.txt', 'content')
-        
         # Factory should select appropriate readers
-        docx_reader = factory.get_reader("docx")
-        zip_reader = factory.get_reader("zip")
+        docx_reader = reader_factory.get_reader("docx")
+        zip_reader = reader_factory.get_reader("zip")
         
         assert isinstance(docx_reader, ZipBasedReader)
         assert isinstance(zip_reader, PlainZipReader)
         
         # Both should validate correctly
-        assert docx_reader.validate_structure(str(docx_file), "docx") is True
-        assert zip_reader.validate_structure(str(zip_file), "zip") is True
+        assert docx_reader.validate_structure(corpus_docx, "docx") is True
+        assert zip_reader.validate_structure(corpus_zip, "zip") is True
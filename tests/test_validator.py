@@ -9,13 +9,17 @@ Tests cover:
 - Integration with Database and ReaderFactory
 """
 
+import hashlib
+import io
+import os
+import shutil
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 import zipfile
 
 import pytest
 
-from magicguard.core.validator import FileValidator
+from magicguard.core.validator import MAX_FILE_SIZE, FileValidator
 from magicguard.core.database import Database
 from magicguard.core.readers import ReaderFactory
 from magicguard.core.exceptions import (
@@ -24,22 +28,137 @@ from magicguard.core.exceptions import (
     SignatureNotFoundError,
 )
 
+# (extension, file content) pairs that match a seeded signature
+VALID_CASES = [
+    ("pdf", b"%PDF-1.4\n"),
+    ("png", b"\x89PNG\r\n\x1a\n"),
+    ("jpg", b"\xFF\xD8\xFF\xE0"),
+    ("jpg", b"\xFF\xD8\xFF\xE1"),
+]
+
+# (extension, file content, expected message fragment) for spoofed files
+SPOOFED_CASES = [
+    ("pdf", b"\x89PNG\r\n\x1a\n", "pdf"),
+    ("png", b"%PDF-1.4", "89504E47"),
+]
+
+
+def _build_zip(members):
+    """Return a stored ZIP archive of the given name -> text members as bytes."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED) as zf:
+        for name, content in members.items():
+            zf.writestr(name, content)
+    return buffer.getvalue()
+
+
+# Archive bytes built once at import and copied into per-test files
+DOCX_SAMPLE = _build_zip({
+    '[Content_Types].xml': '<?xml version="1.0"?>',
+    'word/document.xml': '<document/>',
+})
+NOT_DOCX_SAMPLE = _build_zip({'random.txt': 'content'})
+
+
+@pytest.fixture(scope="session")
+def sample_store(tmp_path_factory):
+    """Provide a session directory and cache of shared sample files."""
+    return tmp_path_factory.mktemp("samples"), {}
+
+
+@pytest.fixture
+def sample_file(sample_store, tmp_path):
+    """Provide a factory that places sample bytes at tmp_path / name.
+    
+    Each distinct payload is written once per session; tests get a hard
+    link to it under their own file name, so they must not modify it.
+    Filesystems without hard links get a copy instead.
+    """
+    store_dir, stored = sample_store
+    
+    def make(name, data):
+        source = stored.get(data)
+        if source is None:
+            source = store_dir / f"sample{len(stored)}"
+            source.write_bytes(data)
+            stored[data] = source
+        target = tmp_path / name
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copyfile(source, target)
+        return target
+    
+    return make
+
+
+@pytest.fixture(scope="session")
+def reader_factory():
+    """Provide one ReaderFactory shared by all tests."""
+    return ReaderFactory()
+
+
+@pytest.fixture(scope="session")
+def signature_template():
+    """Provide an in-memory database seeded with test signatures once."""
+    with Database(db_path=":memory:") as db:
+        db.add_signatures([
+            ("pdf", "25504446", 0, "PDF document", None),
+            ("png", "89504E47", 0, "PNG image", None),
+            ("jpg", "FFD8FFE0", 0, "JPEG image", None),
+            ("jpg", "FFD8FFE1", 0, "JPEG image variant", None),
+            ("docx", "504B0304", 0, "DOCX document", None),
+        ])
+        yield db
+
+
+@pytest.fixture
+def cloned_db(signature_template):
+    """Provide a private database with test signatures.
+    
+    The rows are copied from the session template with the SQLite backup
+    API instead of being inserted again for every test. Use this when the
+    test closes the database.
+    """
+    db = Database(db_path=":memory:")
+    signature_template.conn.backup(db.conn)
+    return db
+
+
+@pytest.fixture(scope="module")
+def shared_db(signature_template):
+    """Provide one database with test signatures for the whole module."""
+    with Database(db_path=":memory:") as db:
+        signature_template.conn.backup(db.conn)
+        yield db
+
+
+@pytest.fixture
+def populated_db(shared_db):
+    """Provide the shared database inside a savepoint.
+    
+    Anything a test writes is rolled back afterwards, so tests see the same
+    rows without rebuilding the database each time. The database must not
+    be closed by the test.
+    """
+    shared_db.conn.execute("SAVEPOINT test_case")
+    yield shared_db
+    shared_db.conn.execute("ROLLBACK TO test_case")
+    shared_db.conn.execute("RELEASE test_case")
+
 
 class TestFileValidatorInitialization:
     """Test FileValidator initialization and dependency injection."""
     
-    def test_init_with_dependencies(self, tmp_path):
+    def test_init_with_dependencies(self, reader_factory):
         """Test initialization with provided dependencies."""
-        db_path = tmp_path / "test.db"
-        database = Database(db_path=str(db_path))
+        database = Database(db_path=":memory:")
         database.add_signature("pdf", "25504446", 0)
         
-        factory = ReaderFactory()
-        
-        validator = FileValidator(database=database, reader_factory=factory)
+        validator = FileValidator(database=database, reader_factory=reader_factory)
         
         assert validator.database is database
-        assert validator.reader_factory is factory
+        assert validator.reader_factory is reader_factory
         database.close()
     
     def test_init_creates_default_database(self):
@@ -62,11 +181,10 @@ class TestFileValidatorInitialization:
         finally:
             validator.close()
     
-    def test_init_with_custom_logger(self, tmp_path):
+    def test_init_with_custom_logger(self):
         """Test initialization with custom logger."""
         mock_logger = MagicMock()
-        db_path = tmp_path / "test.db"
-        database = Database(db_path=str(db_path))
+        database = Database(db_path=":memory:")
         
         validator = FileValidator(database=database, logger=mock_logger)
         
@@ -78,91 +196,46 @@ class TestFileValidation:
     """Test file validation functionality."""
     
     @pytest.fixture
-    def populated_db(self, tmp_path):
-        """Provide database with test signatures."""
-        db = Database(db_path=str(tmp_path / "test.db"))
-        db.add_signature("pdf", "25504446", 0, "PDF document")
-        db.add_signature("png", "89504E47", 0, "PNG image")
-        db.add_signature("jpg", "FFD8FFE0", 0, "JPEG image")
-        db.add_signature("jpg", "FFD8FFE1", 0, "JPEG image variant")
-        db.add_signature("docx", "504B0304", 0, "DOCX document")
-        return db
-    
-    @pytest.fixture
-    def validator(self, populated_db):
+    def validator(self, populated_db, reader_factory):
         """Provide validator with populated database."""
-        factory = ReaderFactory()
-        v = FileValidator(database=populated_db, reader_factory=factory)
-        yield v
-        v.close()
-    
-    def test_validate_valid_pdf(self, validator, tmp_path):
-        """Test validation of valid PDF file."""
-        pdf_file = tmp_path / "test.pdf"
-        pdf_file.write_bytes(b"%PDF-1.4\n")
-        
-        result = validator.validate(str(pdf_file))
-        
-        assert result is True
-    
-    def test_validate_valid_png(self, validator, tmp_path):
-        """Test validation of valid PNG file."""
-        png_file = tmp_path / "test.png"
-        png_file.write_bytes(b"\x89PNG\r\n\x1a\n")
-        
-        result = validator.validate(str(png_file))
-        
-        assert result is True
+        # Not closed: populated_db is shared across the module
+        return FileValidator(database=populated_db, reader_factory=reader_factory)
     
-    def test_validate_valid_jpg(self, validator, tmp_path):
-        """Test validation of valid JPEG file."""
-        jpg_file = tmp_path / "test.jpg"
-        jpg_file.write_bytes(b"\xFF\xD8\xFF\xE0")
+    @pytest.mark.parametrize(
+        "ext,magic",
+        VALID_CASES,
+        ids=["pdf", "png", "jpg", "jpg-variant"],
+    )
+    def test_validate_valid(self, validator, sample_file, ext, magic):
+        """Test validation of files whose magic bytes match the extension."""
+        test_file = sample_file(f"test.{ext}", magic)
         
-        result = validator.validate(str(jpg_file))
+        result = validator.validate(str(test_file))
         
         assert result is True
     
-    def test_validate_jpg_variant(self, validator, tmp_path):
-        """Test validation with multiple signatures for same extension."""
-        jpg_file = tmp_path / "test.jpg"
-        jpg_file.write_bytes(b"\xFF\xD8\xFF\xE1")  # Second variant
-        
-        result = validator.validate(str(jpg_file))
-        
-        assert result is True
-    
-    def test_validate_valid_docx(self, validator, tmp_path):
+    def test_validate_valid_docx(self, validator, sample_file):
         """Test validation of valid DOCX file."""
-        docx_file = tmp_path / "test.docx"
-        with zipfile.ZipFile(docx_file, 'w') as zf:
-            zf.writestr('[Content_Types].xml', '<?xml version="1.0"?>')
-            zf.writestr('word/document.xml', '<document/>')
+        docx_file = sample_file("test.docx", DOCX_SAMPLE)
         
         result = validator.validate(str(docx_file))
         
         assert result is True
     
-    def test_validate_spoofed_pdf(self, validator, tmp_path):
-        """Test detection of spoofed PDF (PNG with .pdf extension)."""
-        fake_pdf = tmp_path / "fake.pdf"
-        fake_pdf.write_bytes(b"\x89PNG\r\n\x1a\n")
+    @pytest.mark.parametrize(
+        "ext,magic,expected",
+        SPOOFED_CASES,
+        ids=["png-as-pdf", "pdf-as-png"],
+    )
+    def test_validate_spoofed(self, validator, sample_file, ext, magic, expected):
+        """Test detection of files whose magic bytes contradict the extension."""
+        fake_file = sample_file(f"fake.{ext}", magic)
         
         with pytest.raises(ValidationError) as exc_info:
-            validator.validate(str(fake_pdf))
+            validator.validate(str(fake_file))
         
         assert "magic bytes don't match" in str(exc_info.value)
-        assert "pdf" in str(exc_info.value).lower()
-    
-    def test_validate_spoofed_png(self, validator, tmp_path):
-        """Test detection of spoofed PNG (PDF with .png extension)."""
-        fake_png = tmp_path / "fake.png"
-        fake_png.write_bytes(b"%PDF-1.4")
-        
-        with pytest.raises(ValidationError) as exc_info:
-            validator.validate(str(fake_png))
-        
-        assert "89504E47" in str(exc_info.value)  # Expected PNG signature
+        assert expected in str(exc_info.value)
     
     def test_validate_file_not_found(self, validator):
         """Test error when file doesn't exist."""
@@ -184,55 +257,62 @@ class TestFileValidation:
     def test_validate_file_too_large(self, validator, tmp_path):
         """Test error when file exceeds maximum size."""
         large_file = tmp_path / "large.pdf"
-        # Create file larger than 100MB (MAX_FILE_SIZE)
-        large_file.write_bytes(b"%PDF" + b"\x00" * (100 * 1024 * 1024 + 1))
+        large_file.write_bytes(b"%PDF")
+        # Extend to just over MAX_FILE_SIZE as a sparse file
+        os.truncate(large_file, MAX_FILE_SIZE + 1)
         
         with pytest.raises(FileReadError) as exc_info:
             validator.validate(str(large_file))
         
         assert "too large" in str(exc_info.value).lower()
     
-    def test_validate_file_no_extension(self, validator, tmp_path):
+    def test_validate_file_no_extension(self, validator, sample_file):
         """Test error when file has no extension."""
-        no_ext = tmp_path / "noextension"
-        no_ext.write_bytes(b"%PDF-1.4")
+        no_ext = sample_file("noextension", b"%PDF-1.4")
         
         with pytest.raises(ValidationError) as exc_info:
             validator.validate(str(no_ext))
         
         assert "no extension" in str(exc_info.value).lower()
     
-    def test_validate_unknown_extension(self, validator, tmp_path):
+    def test_validate_unknown_extension(self, validator, sample_file):
         """Test error when extension not in database."""
-        unknown = tmp_path / "test.unknown"
-        unknown.write_bytes(b"Some data")
+        unknown = sample_file("test.unknown", b"Some data")
         
         with pytest.raises(SignatureNotFoundError) as exc_info:
             validator.validate(str(unknown))
         
         assert "unknown" in str(exc_info.value)
     
-    def test_validate_docx_with_wrong_structure(self, validator, tmp_path):
+    def test_validate_docx_with_wrong_structure(self, validator, sample_file):
         """Test that DOCX with correct magic but wrong structure fails."""
-        fake_docx = tmp_path / "fake.docx"
         # Valid ZIP but not a DOCX
-        with zipfile.ZipFile(fake_docx, 'w') as zf:
-            zf.writestr('random.txt', 'content')
+        fake_docx = sample_file("fake.docx", NOT_DOCX_SAMPLE)
         
         with pytest.raises(ValidationError) as exc_info:
             validator.validate(str(fake_docx))
         
         assert "failed internal structure validation" in str(exc_info.value)
+    
+    def test_validate_without_hard_links(self, validator, sample_file, monkeypatch):
+        """Test that sample files are copied where hard links are unsupported."""
+        def no_link(src, dst):
+            raise OSError("hard links not supported")
+        
+        monkeypatch.setattr(os, "link", no_link)
+        pdf_file = sample_file("copied.pdf", b"%PDF-1.4")
+        
+        assert validator.validate(str(pdf_file)) is True
 
 
 class TestGetFileHash:
     """Test SHA-256 hash calculation."""
     
     @pytest.fixture
-    def validator(self, tmp_path):
+    def validator(self, reader_factory):
         """Provide validator instance."""
-        db = Database(db_path=str(tmp_path / "test.db"))
-        v = FileValidator(database=db)
+        db = Database(db_path=":memory:")
+        v = FileValidator(database=db, reader_factory=reader_factory)
         yield v
         v.close()
     
@@ -268,16 +348,20 @@ class TestGetFileHash:
         assert len(file_hash) == 64  # SHA-256 produces 64 hex chars
         assert all(c in '0123456789abcdef' for c in file_hash)
     
-    def test_hash_large_file(self, validator, tmp_path):
-        """Test hash calculation for larger file (chunked reading)."""
-        large_file = tmp_path / "large.txt"
-        # Write 1MB of data
-        data = b"A" * (1024 * 1024)
-        large_file.write_bytes(data)
+    @pytest.mark.parametrize(
+        "size",
+        [1024, 64 * 1024, 256 * 1024 + 1, 1024 * 1024],
+        ids=["1KiB", "64KiB", "256KiB+1", "1MiB"],
+    )
+    def test_hash_matches_reference(self, validator, tmp_path, size):
+        """Test that streamed hashing matches hashlib on the same bytes."""
+        data = os.urandom(size)
+        test_file = tmp_path / "data.bin"
+        test_file.write_bytes(data)
         
-        file_hash = validator.get_file_hash(str(large_file))
+        file_hash = validator.get_file_hash(str(test_file))
         
-        assert len(file_hash) == 64
+        assert file_hash == hashlib.sha256(data).hexdigest()
     
     def test_hash_file_not_found(self, validator):
         """Test error when file doesn't exist."""
@@ -300,10 +384,9 @@ class TestGetFileHash:
 class TestValidatorContextManager:
     """Test context manager functionality."""
     
-    def test_context_manager_closes_database(self, tmp_path):
+    def test_context_manager_closes_database(self):
         """Test that context manager closes database."""
-        db_path = tmp_path / "test.db"
-        database = Database(db_path=str(db_path))
+        database = Database(db_path=":memory:")
         
         with FileValidator(database=database) as validator:
             assert validator.database.conn is not None
@@ -311,10 +394,9 @@ class TestValidatorContextManager:
         # Database should be closed
         assert validator.database.conn is None
     
-    def test_context_manager_with_exception(self, tmp_path):
+    def test_context_manager_with_exception(self):
         """Test that database closes even if exception occurs."""
-        db_path = tmp_path / "test.db"
-        database = Database(db_path=str(db_path))
+        database = Database(db_path=":memory:")
         
         try:
             with FileValidator(database=database) as validator:
@@ -329,43 +411,36 @@ class TestValidatorContextManager:
 class TestValidatorClose:
     """Test close method."""
     
-    def test_close_closes_database(self, tmp_path):
+    def test_close_closes_database(self, reader_factory):
         """Test that close method closes database connection."""
-        db_path = tmp_path / "test.db"
-        database = Database(db_path=str(db_path))
-        validator = FileValidator(database=database)
-        
-        assert validator.database.conn is not None
-        
-        validator.close()
-        
-        assert validator.database.conn is None
+        with Database(db_path=":memory:") as database:
+            validator = FileValidator(database=database, reader_factory=reader_factory)
+            
+            assert validator.database.conn is not None
+            
+            validator.close()
+            
+            assert validator.database.conn is None
     
-    def test_close_multiple_times(self, tmp_path):
+    def test_close_multiple_times(self, reader_factory):
         """Test that calling close multiple times doesn't raise error."""
-        db_path = tmp_path / "test.db"
-        database = Database(db_path=str(db_path))
-        validator = FileValidator(database=database)
-        
-        validator.close()
-        validator.close()  # Should not raise
+        with Database(db_path=":memory:") as database:
+            validator = FileValidator(database=database, reader_factory=reader_factory)
+            
+            validator.close()
+            validator.close()  # Should not raise
 
 
 class TestValidatorIntegration:
     """Integration tests for validator with real components."""
     
-    def test_full_validation_workflow(self, tmp_path):
+    def test_full_validation_workflow(self, cloned_db, reader_factory, sample_file):
         """Test complete validation workflow."""
         # Setup
-        db_path = tmp_path / "test.db"
-        database = Database(db_path=str(db_path))
-        database.add_signature("pdf", "25504446", 0)
-        
-        validator = FileValidator(database=database)
+        validator = FileValidator(database=cloned_db, reader_factory=reader_factory)
         
         # Create test file
-        pdf_file = tmp_path / "document.pdf"
-        pdf_file.write_bytes(b"%PDF-1.4\nContent here")
+        pdf_file = sample_file("document.pdf", b"%PDF-1.4\nContent here")
         
         # Validate
         result = validator.validate(str(pdf_file))
@@ -378,26 +453,16 @@ class TestValidatorIntegration:
         
         validator.close()
     
-    def test_validation_with_multiple_file_types(self, tmp_path):
+    def test_validation_with_multiple_file_types(self, cloned_db, reader_factory, sample_file):
         """Test validating different file types in sequence."""
-        # Setup database with multiple signatures
-        db_path = tmp_path / "test.db"
-        database = Database(db_path=str(db_path))
-        database.add_signature("pdf", "25504446", 0)
-        database.add_signature("png", "89504E47", 0)
-        database.add_signature("jpg", "FFD8FFE0", 0)
-        
-        validator = FileValidator(database=database)
+        validator = FileValidator(database=cloned_db, reader_factory=reader_factory)
         
         # Create test files
-        pdf_file = tmp_path / "doc.pdf"
-        pdf_file.write_bytes(b"%PDF-1.4")
+        pdf_file = sample_file("doc.pdf", b"%PDF-1.4")
         
-        png_file = tmp_path / "img.png"
-        png_file.write_bytes(b"\x89PNG\r\n\x1a\n")
+        png_file = sample_file("img.png", b"\x89PNG\r\n\x1a\n")
         
-        jpg_file = tmp_path / "photo.jpg"
-        jpg_file.write_bytes(b"\xFF\xD8\xFF\xE0")
+        jpg_file = sample_file("photo.jpg", b"\xFF\xD8\xFF\xE0")
         
         # Validate all
         assert validator.validate(str(pdf_file)) is True
@@ -406,21 +471,14 @@ class TestValidatorIntegration:
         
         validator.close()
     
-    def test_detect_multiple_spoofed_files(self, tmp_path):
+    def test_detect_multiple_spoofed_files(self, cloned_db, reader_factory, sample_file):
         """Test detection of multiple spoofed files."""
-        db_path = tmp_path / "test.db"
-        database = Database(db_path=str(db_path))
-        database.add_signature("pdf", "25504446", 0)
-        database.add_signature("png", "89504E47", 0)
-        
-        validator = FileValidator(database=database)
+        validator = FileValidator(database=cloned_db, reader_factory=reader_factory)
         
         # Create spoofed files
-        fake_pdf = tmp_path / "fake.pdf"
-        fake_pdf.write_bytes(b"\x89PNG\r\n\x1a\n")
+        fake_pdf = sample_file("fake.pdf", b"\x89PNG\r\n\x1a\n")
         
-        fake_png = tmp_path / "fake.png"
-        fake_png.write_bytes(b"%PDF-1.4")
+        fake_png = sample_file("fake.png", b"%PDF-1.4")
         
         # Both should fail validation
         with pytest.raises(ValidationError):